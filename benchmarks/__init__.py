@@ -0,0 +1,8 @@
+"""
+Seeded performance benchmarks for the simulation and render hot paths.
+
+Run ``python -m benchmarks`` from the repository root; results are printed
+(or written with ``--output``) as JSON. The SDL video and audio drivers
+default to ``dummy`` so the suite runs on machines without a display or a
+sound card.
+"""
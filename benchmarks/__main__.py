@@ -0,0 +1,39 @@
+import argparse
+import json
+import sys
+import time
+
+from .harness import SCENARIOS, environment, seed_everything
+from . import scenarios  # noqa: F401  (registers the scenarios)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the Chernobyl benchmarks.")
+    parser.add_argument("names", nargs="*", help=f"Scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the Python and NumPy random generators")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    report = {"environment": environment(), "seed": args.seed, "started_at": time.time(), "results": []}
+    for name in args.names or SCENARIOS:
+        seed_everything(args.seed)
+        for result in SCENARIOS[name]():
+            report["results"].append({"name": name, **result})
+            print(f"{name} {result.get('params', {})}: {result['ops_per_sec']:.1f} ops/s, "
+                  f"p50 {result['frame_ms']['p50']:.3f} ms", file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(text)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
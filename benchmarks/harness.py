@@ -0,0 +1,96 @@
+import os
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+import pygame
+
+SCENARIOS: Dict[str, Callable[..., dict]] = {}
+
+
+def scenario(name: str):
+    """Register a benchmark function under ``name``."""
+    def register(function):
+        SCENARIOS[name] = function
+        return function
+
+    return register
+
+
+def seed_everything(seed: int) -> None:
+    random.seed(seed)
+    np.random.seed(seed)
+
+
+def screen(width: int = 1200, height: int = 780) -> pygame.Surface:
+    if not pygame.get_init():
+        pygame.init()
+    return pygame.display.set_mode((width, height))
+
+
+def percentiles(samples: List[float]) -> dict:
+    milliseconds = np.asarray(samples, dtype=float) * 1000
+    return {
+        "mean": float(milliseconds.mean()),
+        "p50": float(np.percentile(milliseconds, 50)),
+        "p90": float(np.percentile(milliseconds, 90)),
+        "p99": float(np.percentile(milliseconds, 99)),
+        "max": float(milliseconds.max()),
+    }
+
+
+def measure(run: Callable[[], None],
+            repeat: int,
+            prepare: Optional[Callable[[], None]] = None,
+            warmup: int = 3,
+            ops: int = 1) -> dict:
+    """
+    Time ``run`` ``repeat`` times.
+
+    Args:
+        run: The code under test, called once per sample.
+        repeat: Number of timed samples.
+        prepare: Untimed setup called before every sample.
+        warmup: Untimed calls made before measuring.
+        ops: Number of operations one call of ``run`` performs.
+
+    Returns:
+        dict: ``ops_per_sec`` and per-sample ``frame_ms`` percentiles.
+    """
+    for _ in range(warmup):
+        if prepare is not None:
+            prepare()
+        run()
+
+    samples = []
+    for _ in range(repeat):
+        if prepare is not None:
+            prepare()
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+
+    return {
+        "samples": repeat,
+        "ops_per_sec": ops * repeat / sum(samples),
+        "frame_ms": percentiles(samples),
+    }
+
+
+def environment() -> dict:
+    return {
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+        "audio_driver": os.environ.get("SDL_AUDIODRIVER"),
+    }
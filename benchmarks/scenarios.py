@@ -0,0 +1,194 @@
+import numpy as np
+
+from chernobyl import V2D
+from .harness import measure, scenario, screen
+
+
+def populate(sim, atoms: int, neutrons: int) -> None:
+    """Top the simulation up to the requested number of atoms and neutrons."""
+    margin = sim.atoms.default_radius
+    low = (margin, margin)
+    high = (sim.width - margin, sim.height - margin)
+
+    missing = atoms - len(sim.atoms)
+    if missing > 0:
+        angle = np.random.uniform(0, 2 * np.pi, missing)
+        velocity = sim.atom_velocity_mag * np.column_stack([np.cos(angle), np.sin(angle)])
+        sim.atoms.add(np.random.uniform(low, high, (missing, 2)), velocity, health=sim.atom_maximum_health)
+
+    missing = neutrons - len(sim.neutrons)
+    if missing > 0:
+        angle = np.random.uniform(0, 2 * np.pi, missing)
+        velocity = sim.neutron_velocity_mag * np.column_stack([np.cos(angle), np.sin(angle)])
+        sim.neutrons.add(np.random.uniform(low, high, (missing, 2)), velocity)
+
+
+def reactor():
+    from chernobyl.surface.reactor import Reactor
+
+    surface = Reactor(screen(), 0, 100, 1 / 60, seed=int(np.random.randint(2 ** 31)))
+    surface.sim.time_left = float("inf")
+    surface.sim.atom_spawn_probability = 0
+    surface.sim.power_capacity = float("inf")
+    return surface
+
+
+def reactor_frame(surface):
+    """One display frame of the reactor: a fixed simulation step followed by a render."""
+    def frame():
+        surface.update()
+        surface.draw()
+
+    return frame
+
+
+@scenario("reactor_draw")
+def reactor_draw(sizes=(200, 2_000, 20_000), frames: int = 120) -> list:
+    results = []
+    for size in sizes:
+        surface = reactor()
+        atoms = size // 5
+        neutrons = size - atoms
+        surface.sim.atom_capacity = atoms
+
+        result = measure(reactor_frame(surface), frames, prepare=lambda: populate(surface.sim, atoms, neutrons))
+        result["params"] = {"particles": size, "atoms": atoms, "neutrons": neutrons}
+        results.append(result)
+    return results
+
+
+@scenario("chain_reaction")
+def chain_reaction(atoms: int = 1_500, frames: int = 240) -> list:
+    surface = reactor()
+    sim = surface.sim
+    sim.atom_capacity = atoms
+    sim.atom_absorption_ratio = 1.0
+    peak = {"neutrons": 0}
+
+    def prime():
+        if len(sim.neutrons) > 0:
+            peak["neutrons"] = max(peak["neutrons"], len(sim.neutrons))
+            return
+
+        sim.atoms.clear()
+        populate(sim, atoms, 0)
+        sim.atoms.health[:] = 1
+        sim.atoms.health[:atoms // 50] = 0
+
+    result = measure(reactor_frame(surface), frames, prepare=prime)
+    result["params"] = {"atoms": atoms, "peak_neutrons": peak["neutrons"]}
+    return [result]
+
+
+@scenario("v2d_arithmetic")
+def v2d_arithmetic(operations: int = 10_000, repeat: int = 20) -> list:
+    a = V2D(3.0, 4.0)
+    b = V2D(-1.5, 2.5)
+
+    def run():
+        for _ in range(operations // 10):
+            c = a + b
+            c = c - b
+            c = c * 0.5
+            c = 2.0 * c
+            c = c / 3.0
+            c.mag()
+            c.dist(b)
+            c.copy()
+            c.rotate(15)
+            c.unit()
+
+    result = measure(run, repeat, ops=operations)
+    result["params"] = {"operations": operations}
+    return [result]
+
+
+@scenario("board_power_graph")
+def board_power_graph(lengths=(10_000, 100_000, 1_000_000), repeat: int = 20) -> list:
+    from chernobyl.power import PowerAccumulator
+    from chernobyl.surface.board import Board
+
+    board = Board(screen(), 0, 0, 1 / 60)
+    results = []
+    for length in lengths:
+        board.power = PowerAccumulator()
+        board.power.extend(np.random.randint(1, 20, length).tolist())
+
+        def redraw():
+            # Forget what was drawn, so every sample repaints the graph.
+            board.shown = None
+
+        result = measure(board.draw, repeat, prepare=redraw)
+        result["params"] = {"length": length}
+        results.append(result)
+    return results
+
+
+@scenario("menu_items")
+def menu_items(repeat: int = 200) -> list:
+    from chernobyl.surface import Menu
+    from chernobyl.surface.game_over import GameOver
+    from chernobyl.surface.time_over import TimeOver
+    from chernobyl.surface.upgrader import Upgrader
+
+    results = []
+    for screen_class in (Menu, GameOver, TimeOver, Upgrader):
+        surface = screen_class(screen(), 0, 0, 1 / 60)
+
+        def frame():
+            surface.hover_handler()
+            surface.draw()
+
+        result = measure(frame, repeat)
+        result["params"] = {"screen": screen_class.__name__}
+        results.append(result)
+    return results
+
+
+
+@scenario("menu_layout")
+def menu_layout(repeat: int = 50) -> list:
+    from chernobyl.surface import Menu
+    from chernobyl.surface.game_over import GameOver
+    from chernobyl.surface.time_over import TimeOver
+    from chernobyl.surface.upgrader import Upgrader
+
+    results = []
+    for screen_class in (Menu, GameOver, TimeOver, Upgrader):
+        surface = screen_class(screen(), 0, 0, 1 / 60)
+
+        result = measure(surface.items, repeat, prepare=surface.reset)
+        result["params"] = {"screen": screen_class.__name__}
+        results.append(result)
+    return results
+
+@scenario("atom_attraction")
+def atom_attraction(sizes=(200, 2_000, 20_000), repeat: int = 10) -> list:
+    from chernobyl.particle.attraction import Attraction
+
+    results = []
+    for size in sizes:
+        attraction = Attraction(1200, 680, softening=20)
+        positions = np.random.uniform((0, 0), (1200, 680), (size, 2))
+
+        result = measure(lambda: attraction.accelerations(positions, 1.0), repeat, ops=size)
+        result["params"] = {"atoms": size, "theta": attraction.theta}
+        results.append(result)
+    return results
+
+
+@scenario("atom_collisions")
+def atom_collisions(sizes=(200, 500, 2_000), repeat: int = 20) -> list:
+    from chernobyl.simulation import ReactorSim
+
+    results = []
+    for size in sizes:
+        sim = ReactorSim(1200, 680, seed=int(np.random.randint(2 ** 31)))
+        sim.fusion = True
+        populate(sim, size, 0)
+        sim.atom_grid.build(sim.atoms.position, cell_size=sim.collision_distance())
+
+        result = measure(sim.collide_atoms, repeat, ops=size)
+        result["params"] = {"atoms": size, "pairs": len(sim.atom_pairs()[0])}
+        results.append(result)
+    return results
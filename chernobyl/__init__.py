@@ -1,3 +1,14 @@
+from .startup import startup_report
 from .v2d import V2D
-from .sound import Sound
-from .window import Window
\ No newline at end of file
+
+
+def __getattr__(name):
+    # Sound and Window pull in pygame; import them on first use so the
+    # headless simulation can be used without pygame installed.
+    if name == "Sound":
+        from .sound import Sound
+        return Sound
+    if name == "Window":
+        from .window import Window
+        return Window
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
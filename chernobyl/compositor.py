@@ -0,0 +1,52 @@
+from typing import List, Optional
+
+import pygame
+
+from .surface.surface import Surface
+
+
+class Compositor:
+    """
+    Presents scene surfaces on the screen using dirty rectangles.
+
+    When the set of visible scenes or the screen size changes everything is
+    redrawn and flipped. Otherwise only the regions each scene reported with
+    ``Surface.mark_dirty`` are copied to the screen and passed to
+    ``pygame.display.update``; scenes that did not change cost nothing.
+    """
+
+    def __init__(self, screen: pygame.Surface) -> None:
+        self.screen = screen
+        self.scenes: List[Surface] = []
+        self.screen_size: Optional[tuple] = None
+        self.full_redraw = True
+
+    def invalidate(self) -> None:
+        self.full_redraw = True
+
+    def present(self, scenes: List[Surface]) -> List[pygame.Rect]:
+        screen_size = self.screen.get_size()
+        if (self.full_redraw or screen_size != self.screen_size or
+                len(scenes) != len(self.scenes) or any(a is not b for a, b in zip(scenes, self.scenes))):
+            self.screen.fill((0, 0, 0))
+            for scene in scenes:
+                self.screen.blit(scene.surface, (scene.x, scene.y))
+                scene.dirty_rects.clear()
+            pygame.display.flip()
+
+            self.scenes = list(scenes)
+            self.screen_size = screen_size
+            self.full_redraw = False
+            return [self.screen.get_rect()]
+
+        updated = []
+        for scene in scenes:
+            for rect in scene.dirty_rects:
+                screen_rect = rect.move(scene.x, scene.y)
+                self.screen.blit(scene.surface, screen_rect, rect)
+                updated.append(screen_rect)
+            scene.dirty_rects.clear()
+
+        if updated:
+            pygame.display.update(updated)
+        return updated
@@ -0,0 +1,51 @@
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+
+class FontCache:
+    """
+    Cache of ``pygame.font.Font`` objects and of rendered text.
+
+    Fonts are kept by ``(name, size)`` for the life of the process; rendered
+    text surfaces are memoized by ``(text, size, color, name)`` and evicted
+    least-recently-used once more than ``max_renders`` are held. Returned
+    surfaces are shared, so callers must blit them and never draw on them.
+    """
+
+    def __init__(self, max_renders: int = 512) -> None:
+        self.max_renders = max_renders
+        self.fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        self.renders: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
+    def font(self, size: int, name: Optional[str] = None) -> pygame.font.Font:
+        key = name, size
+        font = self.fonts.get(key)
+        if font is None:
+            if name is None:
+                font = pygame.font.Font(None, size)
+            else:
+                font = pygame.font.SysFont(name, size)
+            self.fonts[key] = font
+        return font
+
+    def render(self, text: str, size: int, color: Tuple[int, int, int], name: Optional[str] = None) -> pygame.Surface:
+        key = text, size, tuple(color), name
+        surface = self.renders.get(key)
+        if surface is not None:
+            self.renders.move_to_end(key)
+            return surface
+
+        surface = self.font(size, name).render(text, True, color)
+        self.renders[key] = surface
+        if len(self.renders) > self.max_renders:
+            self.renders.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        self.fonts.clear()
+        self.renders.clear()
+
+
+font_cache = FontCache()
@@ -1,3 +1,4 @@
 from .atom import Atom
 from .neutron import Neutron
 from .rod import Rod
+from .limiter import Limiter
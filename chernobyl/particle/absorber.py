@@ -0,0 +1,128 @@
+from typing import List
+
+import numpy as np
+
+
+class AbsorptionMap:
+    """
+    Raster of the absorber covering each pixel of the reactor.
+
+    Absorbers are rods, limiters or anything else with ``bounds(margin)``,
+    ``absorption_ratio`` and ``revision``. Each absorber footprint is widened
+    by ``margin`` (the radius of the particles that will be looked up) and
+    painted into an integer grid, so finding the absorber under any number
+    of particles is a single fancy index. The grid is only repainted when an
+    absorber's ``revision`` changes, i.e. when a rod or limiter actually
+    moved. ``sweep`` tests whole segments against the same widened
+    footprints instead, so a particle cannot step over a thin rod. Retracted
+    absorbers have empty bounds and are skipped by both.
+    """
+
+    def __init__(self, width: int, height: int, absorbers: List, margin: float = 0.0) -> None:
+        self.width = width
+        self.height = height
+        self.absorbers = absorbers
+        self.margin = margin
+
+        self.grid = np.full((height, width), -1, dtype=np.int16)
+        self.absorption_ratios = np.zeros(0, dtype=float)
+        self.bounds = np.zeros((0, 4), dtype=float)
+        self.thinnest = np.inf
+        self.revisions = None
+
+    def sync(self) -> bool:
+        revisions = [absorber.revision for absorber in self.absorbers]
+        if revisions == self.revisions:
+            return False
+
+        self.revisions = revisions
+        self.rebuild()
+        return True
+
+    def rebuild(self) -> None:
+        self.grid.fill(-1)
+        self.absorption_ratios = np.array([absorber.absorption_ratio for absorber in self.absorbers], dtype=float)
+        self.bounds = np.array([absorber.bounds(self.margin) for absorber in self.absorbers], dtype=float).reshape(-1, 4)
+        extent = np.minimum(self.bounds[:, 2] - self.bounds[:, 0], self.bounds[:, 3] - self.bounds[:, 1])
+        self.thinnest = extent[extent > 0].min(initial=np.inf)
+
+        for index, absorber in enumerate(self.absorbers):
+            x0, y0, x1, y1 = absorber.bounds(self.margin)
+            if x1 <= x0 or y1 <= y0:
+                continue
+
+            column_start = max(int(np.floor(x0)), 0)
+            column_stop = min(int(np.floor(x1)) + 1, self.width)
+            row_start = max(int(np.floor(y0)), 0)
+            row_stop = min(int(np.floor(y1)) + 1, self.height)
+            self.grid[row_start:row_stop, column_start:column_stop] = index
+
+    def lookup(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Find the absorber under each position.
+
+        Args:
+            positions (np.ndarray): ``(n, 2)`` array of positions.
+
+        Returns:
+            np.ndarray: Absorber index per position, ``-1`` where there is none.
+        """
+        column = np.floor(positions[:, 0]).astype(int)
+        row = np.floor(positions[:, 1]).astype(int)
+        inside = (0 <= column) & (column < self.width) & (0 <= row) & (row < self.height)
+
+        found = np.full(len(positions), -1, dtype=int)
+        found[inside] = self.grid[row[inside], column[inside]]
+        return found
+
+    def sweep(self, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+        """
+        Find the first absorber crossed by each segment.
+
+        Segments shorter than the thinnest absorber cannot step over one, so
+        they are looked up in the raster at their end like in ``lookup``;
+        only the longer ones are clipped against every absorber.
+
+        Args:
+            start (np.ndarray): ``(n, 2)`` array of segment starts.
+            end (np.ndarray): ``(n, 2)`` array of segment ends.
+
+        Returns:
+            np.ndarray: Absorber index per segment, ``-1`` where there is none.
+        """
+        found = self.lookup(end)
+        move = end - start
+        long = np.flatnonzero(np.maximum(np.abs(move[:, 0]), np.abs(move[:, 1])) >= self.thinnest)
+        if len(long) == 0:
+            return found
+
+        x, y = start[long, 0], start[long, 1]
+        dx, dy = move[long, 0], move[long, 1]
+        first = np.full(len(long), np.inf)
+        found[long] = -1
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for index, (x0, y0, x1, y1) in enumerate(self.bounds):
+                if x1 <= x0 or y1 <= y0:
+                    continue
+
+                enter = np.zeros(len(long))
+                leave = np.ones(len(long))
+                for origin, direction, low, high in ((x, dx, x0, x1), (y, dy, y0, y1)):
+                    t0 = (low - origin) / direction
+                    t1 = (high - origin) / direction
+                    still = direction == 0
+                    inside = (low <= origin) & (origin <= high)
+                    enter = np.maximum(enter, np.where(still, np.where(inside, 0, np.inf), np.minimum(t0, t1)))
+                    leave = np.minimum(leave, np.where(still, np.where(inside, 1, -np.inf), np.maximum(t0, t1)))
+
+                hit = (enter <= leave) & (enter <= first)
+                first[hit] = enter[hit]
+                found[long[hit]] = index
+
+        return found
+
+    def absorbed(self, found: np.ndarray, roll: np.ndarray) -> np.ndarray:
+        hit = found >= 0
+        hit[hit] = roll[hit] > self.absorption_ratios[found[hit]]
+        return hit
@@ -1,17 +1,19 @@
-from random import random
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
 import numpy as np
 
 from .particle import Particle
 from .. import V2D
-from ..surface.surface import Surface
+from ..rng import RandomStream, per_step
 from ..utils import Fixer
 
+if TYPE_CHECKING:
+    from ..surface.surface import Surface
+
 
 class Atom(Particle):
     def __init__(self,
-                 surface: Surface,
+                 surface: "Surface",
                  position: V2D,
                  health_point: int,
                  velocity: Optional[V2D] = None,
@@ -39,9 +41,8 @@ class Atom(Particle):
     def color(self) -> Tuple[int, int, int]:
         return self.colors[self.health_point - 1]
 
-    def decay(self, dt: float) -> bool:
-        p = 1.0 - (1.0 - self.decay_probability) ** dt
-        return random() < p
+    def decay(self, dt: float, rng: RandomStream) -> bool:
+        return rng.random() < per_step(self.decay_probability, dt)
 
     def decrease_health(self) -> None:
         self.health_point -= 1
@@ -49,6 +50,5 @@ class Atom(Particle):
     def is_dead(self) -> bool:
         return self.health_point == 0
 
-    def absorbed(self, dt: float) -> bool:
-        p = 1.0 - (1.0 - self.absorption_ratio) ** dt
-        return random() < p
+    def absorbed(self, dt: float, rng: RandomStream) -> bool:
+        return rng.random() < per_step(self.absorption_ratio, dt)
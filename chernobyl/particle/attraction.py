@@ -0,0 +1,153 @@
+from math import ceil, log
+from typing import Dict, Tuple
+
+import numpy as np
+
+from .grid import UniformGrid
+
+
+class Attraction:
+    """
+    Approximate inverse-square attraction between many particles.
+
+    A vectorized tree code over a quadtree of uniform grids. Particles closer
+    than ``reach`` cells at the finest level attract each other exactly. Every
+    other particle is reached through the centre of mass of the largest cell
+    that is still well separated: at each level a particle interacts with the
+    cells that are inside its parent's neighbourhood but outside its own,
+    so the cost per particle is a constant number of cells per level, about
+    O(N log N) overall.
+
+    ``theta`` is the accuracy knob, like the opening angle of Barnes–Hut:
+    the neighbourhood spans ``ceil(1 / theta)`` cells, so smaller values
+    treat more of the field exactly. ``softening`` keeps the force finite
+    for overlapping particles.
+    """
+
+    def __init__(self, width: float, height: float, theta: float = 1.0, leaf_size: int = 4,
+                 softening: float = 1.0, max_depth: int = 9) -> None:
+        self.width = width
+        self.height = height
+        self.theta = theta
+        self.leaf_size = leaf_size
+        self.softening = softening
+        self.max_depth = max_depth
+        self.grid = UniformGrid(max(width, height), max(width, height))
+        self.offset_tables: Dict[Tuple[int, int, int], np.ndarray] = {}
+
+    @property
+    def reach(self) -> int:
+        return max(1, ceil(1 / self.theta))
+
+    def depth(self, count: int) -> int:
+        return min(max(ceil(log(max(count / self.leaf_size, 1), 4)), 1), self.max_depth)
+
+    def offsets(self, reach: int, x_parity: int, y_parity: int) -> np.ndarray:
+        """Cell offsets inside the parent's neighbourhood but outside a cell's own, for one child position."""
+        key = reach, x_parity, y_parity
+        if key not in self.offset_tables:
+            dx = np.arange(-2 * reach - x_parity, 2 * reach + 2 - x_parity)
+            dy = np.arange(-2 * reach - y_parity, 2 * reach + 2 - y_parity)
+            offsets = np.stack(np.meshgrid(dx, dy, indexing="ij"), axis=-1).reshape(-1, 2)
+            self.offset_tables[key] = offsets[np.abs(offsets).max(axis=1) > reach]
+        return self.offset_tables[key]
+
+    def pull(self, delta: np.ndarray, mass) -> np.ndarray:
+        distance2 = (delta ** 2).sum(axis=-1) + self.softening ** 2
+        return delta * (mass * distance2 ** -1.5)[..., None]
+
+    def pull_gradient(self, delta: np.ndarray, mass) -> Tuple[np.ndarray, np.ndarray]:
+        """``pull`` and its derivative with respect to the position being pulled."""
+        distance2 = (delta ** 2).sum(axis=-1) + self.softening ** 2
+        scale = mass * distance2 ** -1.5
+        outer = delta[..., :, None] * delta[..., None, :]
+        gradient = (3 * outer / distance2[..., None, None] - np.eye(2)) * scale[..., None, None]
+        return delta * scale[..., None], gradient
+
+    def accelerations(self, positions: np.ndarray, strength: float) -> np.ndarray:
+        """
+        Acceleration of every particle towards all the others.
+
+        Args:
+            positions (np.ndarray): ``(n, 2)`` particle positions.
+            strength (float): Attraction strength, as in ``Neutron.attract_to``.
+
+        Returns:
+            np.ndarray: ``(n, 2)`` accelerations.
+        """
+        count = len(positions)
+        acceleration = np.zeros((count, 2))
+        if count < 2 or strength == 0:
+            return acceleration
+
+        reach = self.reach
+        size = max(self.width, self.height)
+        depth = self.depth(count)
+
+        self.grid.build(positions, cell_size=size / 2 ** depth)
+        query, item = self.grid.candidates(positions, reach)
+        other = query != item
+        query, item = query[other], item[other]
+        pull = self.pull(positions[item] - positions[query], 1.0)
+        acceleration[:, 0] += np.bincount(query, pull[:, 0], minlength=count)
+        acceleration[:, 1] += np.bincount(query, pull[:, 1], minlength=count)
+
+        # Far field, cell to cell: every occupied cell gathers the pull of its
+        # interaction list at its centre of mass as a first order expansion
+        # (field and gradient), inherits its parent's expansion, and the
+        # leaves finally evaluate theirs at each particle.
+        field = np.zeros((1, 2))
+        gradient = np.zeros((1, 2, 2))
+        center = positions.mean(axis=0, keepdims=True)
+        key = np.zeros(count, dtype=int)
+
+        for level in range(1, depth + 1):
+            cells = 2 ** level
+            cell = np.clip((positions // (size / cells)).astype(int), 0, cells - 1)
+            parent_key = key
+            key = cell[:, 0] * cells + cell[:, 1]
+
+            mass = np.bincount(key, minlength=cells * cells)
+            parent_center = center
+            center = np.column_stack([
+                np.bincount(key, positions[:, 0], minlength=cells * cells),
+                np.bincount(key, positions[:, 1], minlength=cells * cells),
+            ]) / np.maximum(mass, 1)[:, None]
+
+            occupied, first = np.unique(key, return_index=True)
+            occupied_cell = cell[first]
+            occupied_parent = parent_key[first]
+
+            shift = center[occupied] - parent_center[occupied_parent]
+            level_field = np.zeros((cells * cells, 2))
+            level_gradient = np.zeros((cells * cells, 2, 2))
+            level_field[occupied] = field[occupied_parent] + np.einsum("nij,nj->ni", gradient[occupied_parent], shift)
+            level_gradient[occupied] = gradient[occupied_parent]
+
+            parity = occupied_cell & 1
+            for x_parity in (0, 1):
+                for y_parity in (0, 1):
+                    rows = np.flatnonzero((parity[:, 0] == x_parity) & (parity[:, 1] == y_parity))
+                    if len(rows) == 0:
+                        continue
+
+                    neighbour = occupied_cell[rows, None, :] + self.offsets(reach, x_parity, y_parity)
+                    inside = ((neighbour >= 0) & (neighbour < cells)).all(axis=-1)
+                    neighbour_key = np.where(inside, neighbour[..., 0] * cells + neighbour[..., 1], 0)
+
+                    targets = occupied[rows]
+                    pull, pull_gradient = self.pull_gradient(center[neighbour_key] - center[targets, None, :],
+                                                             mass[neighbour_key] * inside)
+                    level_field[targets] += pull.sum(axis=1)
+                    level_gradient[targets] += pull_gradient.sum(axis=1)
+
+            field = level_field
+            gradient = level_gradient
+
+        acceleration += field[key] + np.einsum("nij,nj->ni", gradient[key], positions - center[key])
+        return acceleration * strength
+
+    def exact(self, positions: np.ndarray, strength: float) -> np.ndarray:
+        """Direct O(N²) sum, for checking the approximation on small inputs."""
+        delta = positions[None, :, :] - positions[:, None, :]
+        return self.pull(delta, 1.0).sum(axis=1) * strength
@@ -0,0 +1,86 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class UniformGrid:
+    """
+    Uniform grid (spatial hash) over a rectangular area.
+
+    Items are bucketed by the cell containing their position and stored in
+    cell order, so the items of a cell are one contiguous slice. A query
+    returns every item in the 3x3 block of cells around each query point,
+    which covers all items closer than ``cell_size``. Points outside the area
+    are clamped into the border cells.
+    """
+
+    def __init__(self, width: float, height: float, cell_size: float = 32.0) -> None:
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+        self.columns = 1
+        self.rows = 1
+        self.count = 0
+
+        self.order = np.zeros(0, dtype=int)
+        self.cell_start = np.zeros(2, dtype=int)
+
+    def cells(self, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        column = np.clip((positions[:, 0] // self.cell_size).astype(int), 0, self.columns - 1)
+        row = np.clip((positions[:, 1] // self.cell_size).astype(int), 0, self.rows - 1)
+        return column, row
+
+    def build(self, positions: np.ndarray, cell_size: Optional[float] = None) -> None:
+        if cell_size is not None:
+            self.cell_size = max(float(cell_size), 1.0)
+
+        self.columns = max(int(np.ceil(self.width / self.cell_size)), 1)
+        self.rows = max(int(np.ceil(self.height / self.cell_size)), 1)
+        self.count = len(positions)
+
+        column, row = self.cells(positions)
+        keys = column * self.rows + row
+
+        self.order = np.argsort(keys, kind="stable")
+        self.cell_start = np.searchsorted(keys[self.order], np.arange(self.columns * self.rows + 1))
+
+    def candidates(self, points: np.ndarray, reach: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the items in the neighbourhood of each query point.
+
+        Args:
+            points (np.ndarray): ``(n, 2)`` array of query positions.
+            reach (int): Neighbourhood radius in cells; ``1`` is the 3x3 block.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Parallel arrays of query indices
+            and item indices, one entry per candidate pair.
+        """
+        if len(points) == 0 or self.count == 0:
+            return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+
+        column, row = self.cells(points)
+        queries = []
+        starts = []
+        counts = []
+
+        for d_column in range(-reach, reach + 1):
+            for d_row in range(-reach, reach + 1):
+                neighbour_column = column + d_column
+                neighbour_row = row + d_row
+                inside = ((0 <= neighbour_column) & (neighbour_column < self.columns) &
+                          (0 <= neighbour_row) & (neighbour_row < self.rows))
+
+                keys = neighbour_column[inside] * self.rows + neighbour_row[inside]
+                queries.append(np.flatnonzero(inside))
+                starts.append(self.cell_start[keys])
+                counts.append(self.cell_start[keys + 1] - self.cell_start[keys])
+
+        queries = np.concatenate(queries)
+        starts = np.concatenate(starts)
+        counts = np.concatenate(counts)
+
+        total = counts.sum()
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        items = self.order[np.repeat(starts, counts) + offsets]
+        return np.repeat(queries, counts), items
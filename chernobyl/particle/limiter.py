@@ -0,0 +1,51 @@
+from typing import TYPE_CHECKING, Tuple
+
+if TYPE_CHECKING:
+    from ..surface.surface import Surface
+
+
+class Limiter:
+    SIDES = "top", "bottom", "left", "right"
+
+    def __init__(self, surface: "Surface", side: str, depth_ratio: float = 0.1):
+        if side not in self.SIDES:
+            raise ValueError(f"Limiter side must be one of {', '.join(self.SIDES)}")
+
+        self.surface = surface
+        self.side = side
+        self.revision = 0
+        self._insertion = 0.0
+        self.depth_ratio = depth_ratio
+        self.color = 255, 0, 255
+        self.absorption_ratio = 0.5
+
+    @property
+    def insertion(self) -> float:
+        return self._insertion
+
+    @insertion.setter
+    def insertion(self, value: float) -> None:
+        if value != self._insertion:
+            self._insertion = value
+            self.revision += 1
+
+    @property
+    def current_depth(self) -> float:
+        if self.side in ("top", "bottom"):
+            return self.insertion * self.depth_ratio * self.surface.get_height()
+        return self.insertion * self.depth_ratio * self.surface.get_width()
+
+    def bounds(self, margin: float = 0.0) -> Tuple[float, float, float, float]:
+        width, height = self.surface.get_size()
+        depth = self.current_depth
+        if depth <= 0:
+            return 0, 0, -1, -1
+
+        if self.side == "top":
+            return 0, 0, width, depth + margin
+        if self.side == "bottom":
+            return 0, height - depth - margin, width, height
+        if self.side == "left":
+            return 0, 0, depth + margin, height
+        return width - depth - margin, 0, width, height
+
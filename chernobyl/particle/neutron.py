@@ -1,19 +1,31 @@
 import threading
 from random import random
 from time import sleep
-from typing import Optional, Tuple, Self
+from typing import TYPE_CHECKING, Optional, Tuple, Self
 
 from .particle import Particle
-from .. import V2D, Sound
-from ..surface.surface import Surface
+from ..v2d import V2D
+
+if TYPE_CHECKING:
+    from ..surface.surface import Surface
 
 def play_geiger_async():
+    from ..sound import Sound
+
     sleep(0.25 + random() / 2)
     Sound("statics/sounds/geiger.mp3", 0.1 + random() * 0.3).play()
 
+def play_geiger_burst(count: int, limit: int = 8):
+    from ..sound import Sound
+
+    sleep(0.25)
+    for _ in range(min(count, limit)):
+        sleep(random() / 2 / min(count, limit))
+        Sound("statics/sounds/geiger.mp3", 0.1 + random() * 0.3).play()
+
 class Neutron(Particle):
     def __init__(self,
-                 surface: Surface,
+                 surface: "Surface",
                  position: V2D,
                  velocity: Optional[V2D] = None,
                  acceleration: Optional[V2D] = None) -> None:
@@ -1,28 +1,30 @@
-from typing import Optional, Self, Tuple
+from typing import TYPE_CHECKING, Optional, Self, Tuple
 from datetime import timedelta, datetime
 
-from ..surface.surface import Surface
 from ..utils import Fixer
 from ..v2d import V2D
 
+if TYPE_CHECKING:
+    from ..surface.surface import Surface
+
 
 class Particle:
     def __init__(self,
-                 surface: Surface,
+                 surface: "Surface",
                  position: V2D,
                  velocity: Optional[V2D] = None,
                  acceleration: Optional[V2D] = None) -> None:
         self.surface = surface
-        self.position: V2D = position
+        self.position: V2D = position.copy()
         self.velocity: V2D = Fixer.vector(velocity) / 20
-        self.acceleration: V2D = Fixer.vector(acceleration, randomize=False)
+        self.acceleration: V2D = Fixer.vector(acceleration, randomize=False).copy()
         self.radius = 1
         self.time_to_live = 1.0
         self.life = 0
         self.created_at = datetime.now()
 
     @classmethod
-    def random(cls, surface: Surface) -> Self:
+    def random(cls, surface: "Surface") -> Self:
         return Particle(surface, V2D.random(), velocity=V2D.random())
 
     @property
@@ -1,22 +1,35 @@
-from random import random
+from typing import TYPE_CHECKING, Tuple
 
 from .particle import Particle
 from ..v2d import V2D
-from ..surface.surface import Surface
+
+if TYPE_CHECKING:
+    from ..surface.surface import Surface
 
 
 class Rod:
-    def __init__(self, surface: Surface, x: int, dt: float):
+    def __init__(self, surface: "Surface", x: int, dt: float = 0.0):
         self.surface = surface
         self.x = x
         self.y = 0
-        self.insertion = 0.0
+        self.revision = 0
+        self._insertion = 0.0
         self.insertion_rate = 0.1
         self.color = 255, 0, 255
         self.width = 4
         self.absorption_ratio = 0.5
         self.dt = dt
 
+    @property
+    def insertion(self) -> float:
+        return self._insertion
+
+    @insertion.setter
+    def insertion(self, value: float) -> None:
+        if value != self._insertion:
+            self._insertion = value
+            self.revision += 1
+
     @property
     def current_lowness(self) -> float:
         return self.insertion * self.surface.get_height()
@@ -30,14 +43,20 @@ class Rod:
     def lower(self):
         if self.insertion >= 1.0:
             self.insertion = 1.0
-            return
-        self.insertion += self.insertion_rate
+        else:
+            self.insertion += self.insertion_rate
 
     def lift(self):
         if self.insertion <= 0:
             self.insertion = 0
-            return
-        self.insertion -= self.insertion_rate
+        else:
+            self.insertion -= self.insertion_rate
+
+    def bounds(self, margin: float = 0.0) -> Tuple[float, float, float, float]:
+        lowness = self.current_lowness
+        if lowness <= 0:
+            return 0, 0, -1, -1
+        return self.x - margin, 0, self.x + margin, lowness
 
     def collided(self, particle: Particle) -> bool:
         start_y = self.start().y
@@ -52,9 +71,6 @@ class Rod:
 
         return True
 
-    def absorbed(self) -> bool:
-        return self.absorption_ratio > random()
-
     # def show(self):
     #     start_position = self.start()
     #     end_position = self.end()
@@ -0,0 +1,214 @@
+from typing import Optional, Union
+
+import numpy as np
+
+from ..rng import RandomStream
+from ..v2d import V2D
+
+
+def emission_table(size: int = 256) -> np.ndarray:
+    """Unit vectors of ``size`` evenly spaced emission angles, for ``ParticleStore.emit``."""
+    angle = np.linspace(0, 2 * np.pi, size, endpoint=False)
+    return np.column_stack((np.cos(angle), np.sin(angle)))
+
+
+class ParticleStore:
+    """
+    Structure-of-arrays storage for many particles of the same kind.
+
+    Every column is a contiguous NumPy array so a whole frame of movement,
+    escape culling and lifetime expiry is a handful of vectorized operations.
+    Only the first ``len(store)`` rows are in use; ``alive`` marks rows that
+    were killed during the frame and will be dropped by ``compact``. Rows
+    are never deleted one by one, and dropping a few of them only moves as
+    many rows from the end.
+    """
+
+    def __init__(self, radius: float = 1.0, time_to_live: float = np.inf, capacity: int = 64) -> None:
+        self.default_radius = radius
+        self.time_to_live = time_to_live
+        self.size = 0
+
+        self._position = np.zeros((capacity, 2), dtype=float)
+        self._previous = np.zeros((capacity, 2), dtype=float)
+        self._velocity = np.zeros((capacity, 2), dtype=float)
+        self._acceleration = np.zeros((capacity, 2), dtype=float)
+        self._health = np.zeros(capacity, dtype=int)
+        self._initial_health = np.zeros(capacity, dtype=int)
+        self._life = np.zeros(capacity, dtype=float)
+        self._radius = np.zeros(capacity, dtype=float)
+        self._alive = np.zeros(capacity, dtype=bool)
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._alive)
+
+    @property
+    def position(self) -> np.ndarray:
+        return self._position[:self.size]
+
+    @property
+    def previous(self) -> np.ndarray:
+        return self._previous[:self.size]
+
+    @property
+    def velocity(self) -> np.ndarray:
+        return self._velocity[:self.size]
+
+    @property
+    def acceleration(self) -> np.ndarray:
+        return self._acceleration[:self.size]
+
+    @property
+    def health(self) -> np.ndarray:
+        return self._health[:self.size]
+
+    @property
+    def initial_health(self) -> np.ndarray:
+        return self._initial_health[:self.size]
+
+    @property
+    def life(self) -> np.ndarray:
+        return self._life[:self.size]
+
+    @property
+    def radius(self) -> np.ndarray:
+        return self._radius[:self.size]
+
+    @property
+    def alive(self) -> np.ndarray:
+        return self._alive[:self.size]
+
+    def _columns(self):
+        return (self._position, self._previous, self._velocity, self._acceleration, self._health,
+                self._initial_health, self._life, self._radius, self._alive)
+
+    def reserve(self, count: int) -> None:
+        needed = self.size + count
+        if needed <= self.capacity:
+            return
+
+        capacity = max(needed, 2 * self.capacity)
+        (self._position, self._previous, self._velocity, self._acceleration, self._health,
+         self._initial_health, self._life, self._radius, self._alive) = [
+            np.concatenate([column, np.zeros((capacity - len(column),) + column.shape[1:], dtype=column.dtype)])
+            for column in self._columns()
+        ]
+
+    def add(self,
+            position: Union[V2D, np.ndarray],
+            velocity: Optional[Union[V2D, np.ndarray]] = None,
+            acceleration: Optional[Union[V2D, np.ndarray]] = None,
+            health: Union[int, np.ndarray] = 1,
+            radius: Optional[Union[float, np.ndarray]] = None) -> np.ndarray:
+        """
+        Append one or many particles.
+
+        Args:
+            position: A single ``V2D`` or an ``(n, 2)`` array of positions.
+            velocity: Velocities matching ``position``. Defaults to zero.
+            acceleration: Accelerations matching ``position``. Defaults to zero.
+            health: Health point of each new particle.
+            radius: Radius of each new particle. Defaults to the store radius.
+
+        Returns:
+            np.ndarray: Row indices of the new particles.
+        """
+        position = np.atleast_2d(np.asarray(tuple(position) if isinstance(position, V2D) else position, dtype=float))
+        count = len(position)
+        self.reserve(count)
+
+        rows = slice(self.size, self.size + count)
+        self._position[rows] = position
+        self._previous[rows] = position
+        self._velocity[rows] = 0 if velocity is None else (
+            tuple(velocity) if isinstance(velocity, V2D) else velocity)
+        self._acceleration[rows] = 0 if acceleration is None else (
+            tuple(acceleration) if isinstance(acceleration, V2D) else acceleration)
+        self._health[rows] = health
+        self._initial_health[rows] = health
+        self._life[rows] = 0
+        self._radius[rows] = self.default_radius if radius is None else radius
+        self._alive[rows] = True
+
+        self.size += count
+        return np.arange(rows.start, rows.stop)
+
+    def emit(self,
+             origins: np.ndarray,
+             counts: Union[int, np.ndarray],
+             speed: float,
+             rng: RandomStream,
+             directions: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Append whole bursts of particles flying away from their origins.
+
+        Args:
+            origins: ``(k, 2)`` array of burst origins.
+            counts: Number of particles of each burst.
+            speed: Speed of every new particle.
+            rng: Random stream the directions are drawn from, normally the
+                seeded stream of the simulation.
+            directions: Optional ``(m, 2)`` table of unit vectors, see
+                ``emission_table``. Directions are drawn from the table
+                instead of computing a cosine and sine per particle.
+
+        Returns:
+            np.ndarray: Row indices of the new particles.
+        """
+        origins = np.atleast_2d(np.asarray(origins, dtype=float))
+        counts = np.broadcast_to(np.asarray(counts, dtype=int), (len(origins),))
+        total = int(counts.sum())
+        if total == 0:
+            return np.zeros(0, dtype=int)
+
+        velocity = rng.directions(total, directions) * speed
+        return self.add(np.repeat(origins, counts, axis=0), velocity)
+
+    def move(self, delta: float = 1.0) -> None:
+        life = self.life
+        velocity = self.velocity
+
+        self.previous[:] = self.position
+        life += delta
+        velocity += self.acceleration * delta
+        self.position[:] += velocity * delta
+
+    def interpolate(self, alpha: float) -> np.ndarray:
+        """Positions blended between the last two steps, for rendering between fixed updates."""
+        previous = self.previous
+        return previous + (self.position - previous) * alpha
+
+    def escaped(self, width: float, height: float) -> np.ndarray:
+        x = self.position[:, 0]
+        y = self.position[:, 1]
+        radius = self.radius
+        return ~((-radius <= x) & (x < width + radius) & (-radius <= y) & (y < height + radius))
+
+    def end_of_life(self) -> np.ndarray:
+        return self.life >= self.time_to_live
+
+    def is_dead(self) -> np.ndarray:
+        return self.health <= 0
+
+    def kill(self, which: Union[np.ndarray, int]) -> None:
+        self.alive[which] = False
+
+    def compact(self) -> None:
+        """Drop killed rows by moving the survivors from the end into their place, which does not keep row order."""
+        alive = self.alive
+        size = int(np.count_nonzero(alive))
+        if size == self.size:
+            return
+
+        holes = np.flatnonzero(~alive[:size])
+        survivors = size + np.flatnonzero(alive[size:])
+        for column in self._columns():
+            column[holes] = column[survivors]
+        self.size = size
+
+    def clear(self) -> None:
+        self.size = 0
@@ -0,0 +1,141 @@
+from array import array
+from typing import Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+
+class PowerHistory:
+    """
+    Bucketed history of power samples with bounded size.
+
+    Samples are summed into buckets of ``width`` samples each. Whenever the
+    number of buckets reaches twice ``resolution`` neighbouring buckets are
+    merged and ``width`` doubles, so the history always holds between
+    ``resolution`` and ``2 * resolution`` buckets no matter how long the
+    session runs.
+    """
+
+    def __init__(self, resolution: int = 100) -> None:
+        self.resolution = resolution
+        self.width = 1
+        self.sums = []
+        self.counts = []
+
+    def __len__(self) -> int:
+        return len(self.sums)
+
+    def coarsen(self) -> None:
+        self.sums = [sum(self.sums[i:i + 2]) for i in range(0, len(self.sums), 2)]
+        self.counts = [sum(self.counts[i:i + 2]) for i in range(0, len(self.counts), 2)]
+        self.width *= 2
+
+    def append(self, value: float, weight: int = 1) -> None:
+        """
+        Add ``weight`` consecutive samples of ``value``.
+
+        The history is coarsened up front until the run fits, so adding a
+        run costs O(resolution) regardless of its weight.
+        """
+        if weight <= 0:
+            return
+
+        while True:
+            room = self.width - self.counts[-1] if self.counts else 0
+            needed = -(-(weight - room) // self.width) if weight > room else 0
+            if len(self.sums) + needed <= 2 * self.resolution:
+                break
+            self.coarsen()
+
+        if self.counts and self.counts[-1] < self.width:
+            taken = min(weight, self.width - self.counts[-1])
+            self.sums[-1] += value * taken
+            self.counts[-1] += taken
+            weight -= taken
+
+        while weight > 0:
+            taken = min(weight, self.width)
+            self.sums.append(value * taken)
+            self.counts.append(taken)
+            weight -= taken
+
+    def values(self, target: Optional[int] = None) -> np.ndarray:
+        """
+        Return the mean power of at most ``target`` consecutive ranges.
+
+        Args:
+            target (int, optional): Maximum number of points. Defaults to ``resolution``.
+
+        Returns:
+            np.ndarray: Mean power per range, oldest first.
+        """
+        if target is None:
+            target = self.resolution
+
+        sums = np.asarray(self.sums, dtype=float)
+        counts = np.asarray(self.counts, dtype=float)
+        if len(sums) > target:
+            starts = np.linspace(0, len(sums), target + 1, dtype=int)[:-1]
+            sums = np.add.reduceat(sums, starts)
+            counts = np.add.reduceat(counts, starts)
+
+        return sums / np.maximum(counts, 1)
+
+
+class PowerAccumulator:
+    """Running total, peak and bucketed history of the power a session generated."""
+
+    def __init__(self, resolution: int = 100) -> None:
+        self.total = 0
+        self.peak = None
+        self.count = 0
+        self.history = PowerHistory(resolution)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, value: float, weight: int = 1) -> None:
+        if weight <= 0:
+            return
+
+        self.total += value * weight
+        self.count += weight
+        if self.peak is None or value > self.peak:
+            self.peak = value
+        self.history.append(value, weight)
+
+    def extend(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.append(value)
+
+
+class PowerLedger(PowerAccumulator):
+    """
+    Run-length encoded record of the power a session generated.
+
+    Consecutive equal samples share one entry in typed arrays, and power
+    carried over from earlier sessions is stored as a single weighted entry,
+    so memory does not grow with the amount of banked power.
+    """
+
+    def __init__(self, resolution: int = 100) -> None:
+        super().__init__(resolution)
+        self.values = array("d")
+        self.weights = array("Q")
+
+    def append(self, value: float, weight: int = 1) -> None:
+        if weight <= 0:
+            return
+
+        super().append(value, weight)
+        if self.values and self.values[-1] == value:
+            self.weights[-1] += weight
+        else:
+            self.values.append(value)
+            self.weights.append(weight)
+
+    def carry_over(self, amount: int) -> None:
+        """Bank ``amount`` units of power from an earlier session as one entry."""
+        self.append(1, amount)
+
+    def runs(self) -> Iterator[Tuple[float, int]]:
+        return zip(self.values, self.weights)
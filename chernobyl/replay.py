@@ -0,0 +1,181 @@
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, List, NamedTuple, Optional, Union
+
+from .rng import session_seeds
+from .simulation import ReactorSim
+
+ACTIONS = ("Menu", "Continue", "New Game", "Session Over", "New Session", "Upgrade", "Options", "Exit")
+NEW_REACTOR = ("New Game", "Session Over", "New Session")
+
+CLICK = 0
+WHEEL = 1
+ACTION = 2
+
+MAGIC = b"CHRP"
+VERSION = 1
+HEADER = struct.Struct("<4sB16sHHHI")
+EVENT = struct.Struct("<IBhh")
+
+
+class Event(NamedTuple):
+    tick: int
+    kind: int
+    a: int
+    b: int
+
+
+class Recording:
+    """
+    Seed and input of a play session.
+
+    An event's ``tick`` is the number of fixed simulation steps taken before
+    it was handled, ``ticks`` is the number of steps the session lasted.
+    Every reactor of the session is seeded from ``entropy``, so the seed and
+    the inputs are enough to play the session again. On disk a recording is
+    a fixed 31 byte header followed by one 9 byte record per event.
+    """
+
+    def __init__(self, entropy: int, simulation_rate: int, width: int, height: int) -> None:
+        self.entropy = entropy
+        self.simulation_rate = simulation_rate
+        self.width = width
+        self.height = height
+        self.ticks = 0
+        self.events: List[Event] = []
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def click(self, tick: int, x: int, y: int) -> None:
+        self.events.append(Event(tick, CLICK, int(x), int(y)))
+
+    def wheel(self, tick: int, direction: int) -> None:
+        self.events.append(Event(tick, WHEEL, int(direction), 0))
+
+    def action(self, tick: int, name: str) -> None:
+        if name in ACTIONS:
+            self.events.append(Event(tick, ACTION, ACTIONS.index(name), 0))
+
+    def to_bytes(self) -> bytes:
+        header = HEADER.pack(MAGIC, VERSION, self.entropy.to_bytes(16, "little"),
+                             self.simulation_rate, self.width, self.height, self.ticks)
+        return header + b"".join(EVENT.pack(*event) for event in self.events)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Recording":
+        magic, version, entropy, simulation_rate, width, height, ticks = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a chernobyl recording")
+
+        recording = cls(int.from_bytes(entropy, "little"), simulation_rate, width, height)
+        recording.ticks = ticks
+        recording.events = [Event(*event) for event in EVENT.iter_unpack(data[HEADER.size:])]
+        return recording
+
+    def save(self, path: Union[str, Path]) -> None:
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Recording":
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+class Replay:
+    """
+    Headless, faster than real time playback of a ``Recording``.
+
+    Mirrors what ``Window`` does with the recorded input: menu actions start,
+    pause and resume reactors, clicks and wheel moves go to the running
+    reactor, and a reactor ends on a power surge or when its time is up.
+    Every finished reactor is kept in ``sessions``.
+    """
+
+    def __init__(self, recording: Recording) -> None:
+        self.recording = recording
+        self.dt = 1.0 / recording.simulation_rate
+        self.seeds: Iterator[int] = session_seeds(recording.entropy)
+
+        self.tick = 0
+        self.sim: Optional[ReactorSim] = None
+        self.paused = False
+        self.sessions: List[ReactorSim] = []
+
+    def apply(self, event: Event) -> None:
+        if event.kind == ACTION:
+            name = ACTIONS[event.a]
+            if name in NEW_REACTOR:
+                self.end_session()
+                self.sim = ReactorSim(self.recording.width, self.recording.height, seed=next(self.seeds))
+                self.paused = False
+            elif name == "Menu":
+                self.paused = True
+            elif name == "Continue":
+                self.paused = False
+            return
+
+        if self.sim is None or self.paused:
+            return
+
+        if event.kind == CLICK:
+            self.sim.click((event.a, event.b))
+        elif event.kind == WHEEL:
+            if event.a > 0:
+                self.sim.lift_rods()
+            elif event.a < 0:
+                self.sim.lower_rods()
+
+    def end_session(self) -> None:
+        if self.sim is not None:
+            self.sessions.append(self.sim)
+        self.sim = None
+
+    def update(self) -> None:
+        self.tick += 1
+        if self.sim is None or self.paused:
+            return
+
+        self.sim.step(self.dt)
+        if self.sim.power_surge or self.sim.time_left < 0:
+            self.end_session()
+
+    def run(self, ticks: Optional[int] = None) -> List[ReactorSim]:
+        """
+        Play the recording.
+
+        Args:
+            ticks (Optional[int]): Steps to simulate. Defaults to the length
+                of the recording.
+
+        Returns:
+            List[ReactorSim]: The reactors of the session, in order.
+        """
+        events = self.recording.events
+        if ticks is None:
+            ticks = max(self.recording.ticks, events[-1].tick if events else 0)
+
+        index = 0
+        while self.tick <= ticks:
+            while index < len(events) and events[index].tick <= self.tick:
+                self.apply(events[index])
+                index += 1
+            if self.tick == ticks:
+                break
+            self.update()
+
+        self.end_session()
+        return self.sessions
+
+
+if __name__ == "__main__":
+    for path in sys.argv[1:]:
+        recording = Recording.load(path)
+        start = time.perf_counter()
+        sessions = Replay(recording).run()
+        elapsed = time.perf_counter() - start
+
+        print(f"{path}: {len(recording)} events, {len(sessions)} sessions in {elapsed:.3f}s")
+        for sim in sessions:
+            print(f"  power {sim.total_power:g}, surge {sim.power_surge}, time left {sim.time_left:.2f}")
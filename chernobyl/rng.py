@@ -0,0 +1,58 @@
+from functools import lru_cache
+from typing import Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+@lru_cache(maxsize=256)
+def per_step(probability: float, dt: float) -> float:
+    """Chance of an event with ``probability`` per second happening during a step of ``dt`` seconds."""
+    return 1.0 - (1.0 - probability) ** dt
+
+
+def session_seeds(entropy: Optional[int] = None) -> Iterator[int]:
+    """Endless, reproducible series of reactor seeds derived from ``entropy``."""
+    sequence = np.random.SeedSequence(entropy)
+    while True:
+        yield int(sequence.spawn(1)[0].generate_state(1)[0])
+
+
+class RandomStream:
+    """
+    Seedable random numbers for one reactor session.
+
+    Every roll of the simulation goes through one ``numpy.random.Generator``,
+    drawn a whole batch at a time, so a session started with the same seed
+    and fed the same input plays out identically.
+    """
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self.seed = seed
+        self.generator = np.random.default_rng(seed)
+
+    def reseed(self, seed: Optional[int] = None) -> None:
+        self.seed = seed
+        self.generator = np.random.default_rng(seed)
+
+    def random(self, size: Optional[int] = None):
+        return self.generator.random(size)
+
+    def rolls(self, *sizes: int) -> Tuple[np.ndarray, ...]:
+        """Draw several arrays of uniform rolls with a single call to the generator."""
+        batch = self.generator.random(sum(sizes))
+        return tuple(np.split(batch, np.cumsum(sizes)[:-1]))
+
+    def weighted(self, weights: Sequence[float], size: Optional[int] = None):
+        """Draw indices with the given relative weights."""
+        weights = np.asarray(weights, dtype=float)
+        cumulative = np.cumsum(weights / weights.sum())
+        index = np.searchsorted(cumulative, self.generator.random(size))
+        return np.minimum(index, len(weights) - 1)
+
+    def directions(self, size: int, table: Optional[np.ndarray] = None) -> np.ndarray:
+        """Random unit vectors, optionally picked from a precomputed ``table`` of directions."""
+        if table is not None:
+            return table[self.generator.integers(len(table), size=size)]
+
+        angle = self.generator.uniform(0, 2 * np.pi, size)
+        return np.column_stack((np.cos(angle), np.sin(angle)))
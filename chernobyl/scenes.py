@@ -0,0 +1,47 @@
+from typing import Dict, Iterable, List, Optional, Type, TypeVar
+
+import pygame
+
+from .surface.surface import Surface
+
+S = TypeVar("S", bound=Surface)
+
+
+class SceneManager:
+    """
+    Pool of scenes with one instance per scene type.
+
+    Scenes are built the first time they are asked for and reused after
+    that, so switching between them allocates no surfaces and decodes no
+    sounds. ``show`` calls ``exit`` on the scenes that are no longer visible
+    and ``enter`` on the ones that just became visible; those hooks start and
+    stop the looping sounds of a scene.
+    """
+
+    def __init__(self, screen: pygame.Surface, dt: float) -> None:
+        self.screen = screen
+        self.dt = dt
+        self.pool: Dict[type, Surface] = {}
+        self.active: List[Surface] = []
+
+    def get(self, kind: Type[S], x: int = 0, y: int = 0) -> S:
+        scene = self.pool.get(kind)
+        if scene is None:
+            scene = kind(self.screen, x, y, self.dt)
+            self.pool[kind] = scene
+        return scene
+
+    def show(self, scenes: Iterable[Optional[Surface]]) -> None:
+        scenes = [scene for scene in scenes if scene is not None]
+        for scene in self.active:
+            if all(scene is not other for other in scenes):
+                scene.exit()
+
+        for scene in scenes:
+            if all(scene is not other for other in self.active):
+                scene.enter()
+
+        self.active = scenes
+
+    def close(self) -> None:
+        self.show([])
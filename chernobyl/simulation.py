@@ -0,0 +1,435 @@
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from .particle import Atom, Neutron, Rod, Limiter
+from .particle.absorber import AbsorptionMap
+from .particle.attraction import Attraction
+from .particle.grid import UniformGrid
+from .particle.particle import Particle
+from .particle.store import ParticleStore
+from .power import PowerLedger
+from .rng import RandomStream, per_step
+from .timing import NULL_TIMER, FrameTimer
+
+
+class Area:
+    """Size-only stand-in for ``pygame.Surface`` used by the headless simulation."""
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+
+    def get_width(self) -> int:
+        return self.width
+
+    def get_height(self) -> int:
+        return self.height
+
+    def get_size(self) -> Tuple[int, int]:
+        return self.width, self.height
+
+
+def exchange_impulse(first: ParticleStore, first_index: np.ndarray,
+                     second: ParticleStore, second_index: np.ndarray) -> np.ndarray:
+    """
+    Vectorized ``Particle.bounce`` between rows of two stores, which may be the same store.
+
+    Returns:
+        np.ndarray: Closing speed of every pair along its normal, ``0`` for
+        pairs that were already separating.
+    """
+    delta = first.position[first_index] - second.position[second_index]
+    distance = np.hypot(delta[:, 0], delta[:, 1])
+    normal = delta / np.maximum(distance, 0.1)[:, None]
+
+    rel_vel = first.velocity[first_index] - second.velocity[second_index]
+    vel_along_normal = np.einsum("ij,ij->i", rel_vel, normal)
+
+    m1 = first.radius[first_index]
+    m2 = second.radius[second_index]
+
+    impulse = (2 * vel_along_normal) / (m1 + m2)
+    impulse[(distance < 0.1) | (vel_along_normal > 0)] = 0
+
+    np.subtract.at(first.velocity, first_index, (impulse * m2)[:, None] * normal)
+    np.add.at(second.velocity, second_index, (impulse * m1)[:, None] * normal)
+    return np.where(impulse == 0, 0.0, -vel_along_normal)
+
+
+def segment_entry(x: np.ndarray, y: np.ndarray, dx: np.ndarray, dy: np.ndarray, radius: np.ndarray) -> np.ndarray:
+    """
+    Fraction of each segment travelled before it enters its circle.
+
+    Segments start at ``(x, y)``, relative to the centre of their circle, and
+    move by ``(dx, dy)``. Coordinates come as separate columns, which are much
+    cheaper to gather than rows of an ``(n, 2)`` array.
+
+    Returns:
+        np.ndarray: ``0`` for segments starting inside their circle, ``inf``
+        for segments that miss it.
+    """
+    a = dx * dx + dy * dy
+    b = x * dx + y * dy
+    c = x * x + y * y - radius * radius
+    discriminant = b * b - a * c
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        entry = (-b - np.sqrt(np.maximum(discriminant, 0))) / a
+    entry[~((a > 0) & (discriminant > 0) & (0 <= entry) & (entry <= 1))] = np.inf
+    entry[c < 0] = 0
+    return entry
+
+
+class ReactorSim:
+    """
+    Headless reactor physics.
+
+    Holds the atoms, neutrons, rods and limiters of a session and advances
+    them with ``step``. Nothing here touches pygame, the display or the
+    mixer; ``on_release`` is called with the number of neutrons released by
+    every batch of bursts so a renderer can play sounds for it. All rolls
+    come from ``rng``, so two sessions with the same ``seed`` and the same
+    input play out identically.
+    """
+
+    def __init__(self, width: int, height: int, on_release: Optional[Callable[[int], None]] = None,
+                 seed: Optional[int] = None) -> None:
+        self.area = Area(width, height)
+        self.on_release = on_release
+        self.rng = RandomStream()
+        self.emission_directions: Optional[np.ndarray] = None
+        self.timer = NULL_TIMER
+
+        self.atoms = ParticleStore(radius=20)
+        self.neutrons = ParticleStore(radius=5, time_to_live=1)
+        self.atom_grid = UniformGrid(width, height)
+        self.rods = [
+            Rod(self.area, int(x))
+            for x in np.linspace(100, width - 100, 10)
+        ]
+        self.limiters = [Limiter(self.area, side) for side in Limiter.SIDES]
+        self.absorption_map = AbsorptionMap(width, height, self.limiters + self.rods,
+                                            margin=self.neutrons.default_radius)
+        self.attraction = Attraction(width, height, softening=self.atoms.default_radius)
+        self.attracting = False
+        self.reset(seed)
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        """
+        Start a new session in place.
+
+        Tunables, score and power go back to their defaults, particles are
+        cleared and absorbers pulled out, while the particle arrays, grid and
+        absorption raster are kept for reuse. An enabled profile restarts
+        empty, so every session gets its own timings.
+        """
+        self.rng.reseed(seed)
+
+        self.current_score = 0
+
+        self.available_clicks = 3
+        self.power_capacity = 4
+        self.total_power = 0
+
+        self.time_left = 10
+        self.critical_hit_probability = 0.5
+
+        self.neutron_velocity_mag = 250
+        self.neutron_release = 2.5
+
+        self.atom_capacity = 200
+        self.atom_velocity_mag = 100
+        self.atom_spawn_probability = 0.5
+        self.atom_decay_probability = 0.01
+        self.atom_attraction_strength = 0.0
+        self.atom_absorption_ratio = 0.25
+        self.atom_maximum_health = 4
+
+        self.power_surge = False
+
+        self.swept_collisions = True
+
+        self.fusion = False
+        self.fusion_speed = 150
+        self.fusion_power = 1
+        self.fusions = np.zeros((0, 2), dtype=int)
+
+        self.generated_power = PowerLedger()
+        self.attracting = False
+        self.atoms.clear()
+        self.neutrons.clear()
+        self.atom_grid.build(self.atoms.position, cell_size=self.collision_distance())
+        if self.timer.enabled:
+            self.timer = FrameTimer()
+        for absorber in self.limiters + self.rods:
+            absorber.insertion = 0.0
+
+    @property
+    def width(self) -> int:
+        return self.area.get_width()
+
+    @property
+    def height(self) -> int:
+        return self.area.get_height()
+
+    def add_atom(self, atom: Atom) -> None:
+        index = self.atoms.add(atom.position, atom.velocity, atom.acceleration, atom.health_point, atom.radius)
+        self.atoms.initial_health[index] = atom.initial_health_point
+
+    def add_neutron(self, neutron: Neutron) -> None:
+        self.neutrons.add(neutron.position, neutron.velocity, neutron.acceleration, neutron.health_point,
+                          neutron.radius)
+
+    def add(self, particle: Particle) -> None:
+        if isinstance(particle, Neutron):
+            self.add_neutron(particle)
+        elif isinstance(particle, Atom):
+            self.add_atom(particle)
+
+    def release_neutrons(self, positions: np.ndarray, counts: np.ndarray) -> None:
+        """
+        Emit one burst of neutrons from every position.
+
+        Args:
+            positions (np.ndarray): ``(k, 2)`` array of burst origins.
+            counts (np.ndarray): Number of neutrons of each burst.
+        """
+        released = len(self.neutrons.emit(positions, counts, self.neutron_velocity_mag,
+                                           self.rng, self.emission_directions))
+
+        if self.on_release is not None and released > 0:
+            self.on_release(released)
+
+    def calculate_atom_health(self, r: float = 1.5):
+        weights = [r ** (h - 1) for h in range(1, self.atom_maximum_health + 1)]
+        return int(self.rng.weighted(weights)) + 1
+
+    def collision_distance(self) -> float:
+        if len(self.atoms) == 0 or len(self.neutrons) == 0:
+            return self.atom_grid.cell_size
+        return self.atoms.radius.max() + self.neutrons.radius.max()
+
+    def spawn_atom(self) -> None:
+        spawn, x, y = self.rng.random(3)
+        if spawn > self.atom_spawn_probability:
+            return
+
+        if len(self.atoms) >= self.atom_capacity:
+            return
+
+        position = (10 + x * (self.width - 10), 10 + y * (self.height - 10))
+        velocity = self.rng.directions(1) * self.atom_velocity_mag
+        self.atoms.add(position, velocity, health=self.atom_maximum_health)
+
+    def atom_at(self, point: Tuple[float, float]) -> Optional[int]:
+        _, candidates = self.atom_grid.candidates(np.array([point], dtype=float))
+        candidates = np.concatenate([candidates, np.arange(self.atom_grid.count, len(self.atoms))])
+
+        distance = np.hypot(*(self.atoms.position[candidates] - point).T)
+        picked = candidates[(distance < self.atoms.radius[candidates]) & self.atoms.alive[candidates]]
+        if len(picked) == 0:
+            return None
+        return picked.max()
+
+    def click(self, point: Tuple[float, float]) -> bool:
+        atom_index = self.atom_at(point)
+        if atom_index is None:
+            return False
+
+        self.release_neutrons(self.atoms.position[atom_index],
+                              int(self.atoms.initial_health[atom_index] * self.neutron_release))
+        self.atoms.kill(atom_index)
+        return True
+
+    def profile(self, enabled: bool = True) -> None:
+        """Turn the per-phase step timers in ``timer`` on or off."""
+        if enabled != self.timer.enabled:
+            self.timer = FrameTimer() if enabled else NULL_TIMER
+
+    def attract_atoms(self) -> None:
+        """Write the atoms' mutual attraction into their acceleration, or clear it once attraction is off."""
+        if self.atom_attraction_strength == 0 and not self.attracting:
+            return
+
+        self.atoms.acceleration[:] = self.attraction.accelerations(self.atoms.position, self.atom_attraction_strength)
+        self.attracting = self.atom_attraction_strength != 0
+
+    def lift_rods(self) -> None:
+        for rod in self.rods:
+            rod.lift()
+
+    def lower_rods(self) -> None:
+        for rod in self.rods:
+            rod.lower()
+
+    def bounce(self, atom_index: np.ndarray, neutron_index: np.ndarray) -> None:
+        exchange_impulse(self.atoms, atom_index, self.neutrons, neutron_index)
+
+    def neutron_hits(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        The atom each neutron collided with during its last move.
+
+        With ``swept_collisions`` the whole path from ``previous`` to
+        ``position`` is tested and a neutron hits the first atom it entered,
+        so it cannot pass through an atom between two steps. Otherwise only
+        its current position is tested.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Atom and neutron index
+            of every hit, and the fraction of the move the neutron made
+            before touching the atom.
+        """
+        atoms = self.atoms
+        neutrons = self.neutrons
+
+        if not self.swept_collisions:
+            neutron_index, atom_index = self.atom_grid.candidates(neutrons.position)
+            distance = np.hypot(*(atoms.position[atom_index] - neutrons.position[neutron_index]).T)
+            collided = distance < atoms.radius[atom_index] + neutrons.radius[neutron_index]
+
+            hit = np.full(len(neutrons), -1)
+            np.maximum.at(hit, neutron_index[collided], atom_index[collided])
+            hit_neutrons = np.flatnonzero(hit >= 0)
+            return hit[hit_neutrons], hit_neutrons, np.ones(len(hit_neutrons))
+
+        start = neutrons.previous
+        move = neutrons.position - start
+        neutron_index, atom_index = self.atom_grid.candidates(start + move / 2)
+        entry = segment_entry(start[:, 0][neutron_index] - atoms.position[:, 0][atom_index],
+                              start[:, 1][neutron_index] - atoms.position[:, 1][atom_index],
+                              move[:, 0][neutron_index], move[:, 1][neutron_index],
+                              atoms.radius[atom_index] + neutrons.radius[neutron_index])
+
+        first = np.full(len(neutrons), np.inf)
+        np.minimum.at(first, neutron_index, entry)
+        earliest = np.isfinite(entry) & (entry == first[neutron_index])
+
+        hit = np.full(len(neutrons), -1)
+        np.maximum.at(hit, neutron_index[earliest], atom_index[earliest])
+        hit_neutrons = np.flatnonzero(hit >= 0)
+        return hit[hit_neutrons], hit_neutrons, first[hit_neutrons]
+
+    def atom_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Pairs of touching atoms, each once, from the grid built for the current positions."""
+        atoms = self.atoms
+        if len(atoms) < 2:
+            return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+
+        reach = int(np.ceil(2 * atoms.radius.max() / self.atom_grid.cell_size))
+        first, second = self.atom_grid.candidates(atoms.position, reach)
+        once = first < second
+        first, second = first[once], second[once]
+
+        distance = np.hypot(*(atoms.position[first] - atoms.position[second]).T)
+        touching = distance < atoms.radius[first] + atoms.radius[second]
+        return first[touching], second[touching]
+
+    def collide_atoms(self) -> float:
+        """
+        Bounce touching atoms off each other and fuse the pairs that meet fast enough.
+
+        Returns:
+            float: Power released by fusion.
+        """
+        first, second = self.atom_pairs()
+        approach = exchange_impulse(self.atoms, first, self.atoms, second)
+        fused = approach >= self.fusion_speed
+        self.fusions = np.column_stack([first[fused], second[fused]])
+        return self.fusion_power * len(self.fusions)
+
+    def collide(self, atom_index: np.ndarray, neutron_index: np.ndarray, dt: float) -> None:
+        atoms = self.atoms
+        neutrons = self.neutrons
+
+        absorption_roll, critical_roll = self.rng.rolls(len(atom_index), len(atom_index))
+        absorbed = absorption_roll < per_step(self.atom_absorption_ratio, dt)
+        critical_multiplier = np.where(self.critical_hit_probability > critical_roll, 1, 2)
+
+        speed = np.hypot(*neutrons.velocity[neutron_index].T)
+        damage = (neutrons.health[neutron_index] + np.log10(np.maximum(speed // 3, 1))).astype(int)
+        damage *= critical_multiplier
+
+        np.subtract.at(atoms.health, atom_index[absorbed], damage[absorbed])
+        np.maximum(atoms.health, 0, out=atoms.health)
+
+        self.bounce(atom_index, neutron_index)
+        neutrons.kill(neutron_index)
+
+    def step(self, dt: float) -> float:
+        """
+        Advance the reactor by one time step.
+
+        Args:
+            dt (float): Step length in seconds.
+
+        Returns:
+            float: Power generated during the step.
+        """
+        timer = self.timer
+        timer.begin()
+
+        self.time_left -= dt
+        power = 0
+        atoms = self.atoms
+        neutrons = self.neutrons
+
+        absorber_roll, decay_roll = self.rng.rolls(len(neutrons), len(atoms))
+
+        self.absorption_map.sync()
+        if self.swept_collisions:
+            absorber = self.absorption_map.sweep(neutrons.previous, neutrons.position)
+        else:
+            absorber = self.absorption_map.lookup(neutrons.position)
+        neutrons.kill(self.absorption_map.absorbed(absorber, absorber_roll))
+        neutrons.compact()
+        timer.lap("absorb")
+
+        escaped = atoms.escaped(self.width, self.height)
+        dead = atoms.alive & ~escaped & atoms.is_dead()
+        decay_probability = per_step(self.atom_decay_probability, dt)
+        decayed = atoms.alive & ~escaped & ~dead & (decay_roll < decay_probability)
+
+        power += atoms.initial_health[dead].sum()
+        power += (atoms.health[decayed] / 2).sum() + (atoms.initial_health[decayed] // 2).sum()
+
+        self.release_neutrons(atoms.position[dead],
+                              (atoms.initial_health[dead] * self.neutron_release).astype(int))
+        self.release_neutrons(atoms.position[decayed],
+                              (atoms.initial_health[decayed] * self.neutron_release).astype(int) // 2)
+
+        atoms.kill(escaped | dead | decayed)
+        atoms.compact()
+        self.attract_atoms()
+        atoms.move(dt)
+
+        cell_size = self.collision_distance()
+        if self.swept_collisions and len(neutrons) > 0:
+            cell_size += np.hypot(*(neutrons.position - neutrons.previous).T).max() / 2
+        self.atom_grid.build(atoms.position, cell_size=cell_size)
+        if self.fusion:
+            power += self.collide_atoms()
+        timer.lap("atoms")
+
+        neutrons.kill(neutrons.escaped(self.width, self.height) | neutrons.end_of_life())
+        neutrons.compact()
+
+        atom_index, neutron_index, entry = self.neutron_hits()
+        previous = neutrons.previous[neutron_index]
+        neutrons.position[neutron_index] = previous + (neutrons.position[neutron_index] - previous) * entry[:, None]
+        self.collide(atom_index, neutron_index, dt)
+
+        neutrons.compact()
+        neutrons.move(dt)
+        timer.lap("neutrons")
+
+        self.power_surge = power > self.power_capacity
+
+        self.total_power += power
+        if power > 0:
+            self.generated_power.append(int(power))
+
+        self.spawn_atom()
+        timer.lap("spawn")
+        timer.end(len(atoms), len(neutrons))
+        return power
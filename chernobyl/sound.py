@@ -1,21 +1,151 @@
+import threading
 from pathlib import Path
-from typing import Union
+from typing import Callable, Dict, Iterable, List, Optional, Union
 import pygame
 
+SOUNDS_DIRECTORY = Path("statics/sounds")
+
+
+class SoundBank:
+    """
+    Process-wide cache of decoded sounds.
+
+    Every file is decoded once and the resulting ``pygame.mixer.Sound`` is
+    shared by everyone who asks for the same path. Volume is applied per
+    channel by ``Sound`` so sharing a handle does not couple volumes. The
+    mixer is initialized by the first load, so it can happen on the
+    background thread started by ``preload``. A file the background thread
+    fails to decode still notifies its listeners, which find it not
+    ``ready``, and is left to be loaded, and fail loudly, on first use.
+    """
+
+    def __init__(self) -> None:
+        self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self.listeners: Dict[str, List[Callable[[], None]]] = {}
+        self.lock = threading.Lock()
+        self.decoding = threading.Lock()
+        self.warm_up: Optional[threading.Thread] = None
+
+    def ready(self, path: Union[str, Path]) -> bool:
+        return str(path) in self.sounds
+
+    def loading(self) -> bool:
+        return self.warm_up is not None and self.warm_up.is_alive()
+
+    def get(self, path: Union[str, Path]) -> pygame.mixer.Sound:
+        key = str(path)
+        sound = self.sounds.get(key)
+        if sound is not None:
+            return sound
+
+        with self.decoding:
+            sound = self.sounds.get(key)
+            if sound is None:
+                if not pygame.mixer.get_init():
+                    pygame.mixer.init()
+                sound = pygame.mixer.Sound(key)
+
+        with self.lock:
+            self.sounds[key] = sound
+            listeners = self.listeners.pop(key, [])
+
+        for listener in listeners:
+            listener()
+        return sound
+
+    def when_loaded(self, path: Union[str, Path], callback: Callable[[], None]) -> None:
+        """Call ``callback`` once ``path`` is decoded, right away if it already is."""
+        key = str(path)
+        with self.lock:
+            if key not in self.sounds:
+                self.listeners.setdefault(key, []).append(callback)
+                return
+        callback()
+
+    def preload(self, paths: Optional[Iterable[Union[str, Path]]] = None,
+                background: bool = False, first: Iterable[Union[str, Path]] = ()) -> Optional[threading.Thread]:
+        if paths is None:
+            paths = sorted(SOUNDS_DIRECTORY.glob("*.mp3"))
+        first = [str(path) for path in first]
+        paths = first + [str(path) for path in paths if str(path) not in first]
+
+        if background:
+            self.warm_up = threading.Thread(target=self.warm, args=(paths,), daemon=True)
+            self.warm_up.start()
+            return self.warm_up
+
+        for path in paths:
+            self.get(path)
+        return None
+
+    def warm(self, paths: List[str]) -> None:
+        for path in paths:
+            try:
+                self.get(path)
+            except (pygame.error, OSError):
+                self.notify(path)
+        self.notify()
+
+    def notify(self, path: Optional[str] = None) -> None:
+        """Call and drop the listeners of ``path``, or of every path, whether or not it loaded."""
+        with self.lock:
+            if path is None:
+                listeners = [listener for waiting in self.listeners.values() for listener in waiting]
+                self.listeners.clear()
+            else:
+                listeners = self.listeners.pop(path, [])
+
+        for listener in listeners:
+            listener()
+
+    def clear(self) -> None:
+        with self.decoding, self.lock:
+            self.sounds.clear()
+
+
+sound_bank = SoundBank()
+
 
 class Sound:
     def __init__(self, path: Union[str, Path], volume: float = 1.0):
-        self.sound = pygame.mixer.Sound(str(path))
-        self.sound.set_volume(volume)
+        self.path = str(path)
+        self.volume = volume
         self.channel = None
+        self.pending = False
+
+    @property
+    def sound(self) -> pygame.mixer.Sound:
+        return sound_bank.get(self.path)
+
+    def playing(self) -> bool:
+        return self.pending or (self.channel is not None and self.channel.get_sound() is self.sound)
 
     def play(self, loop: bool = False):
+        if sound_bank.loading() and not sound_bank.ready(self.path):
+            # Start once the warm-up thread has decoded the file instead of
+            # decoding it on this frame.
+            self.pending = True
+            sound_bank.when_loaded(self.path, lambda: self.resume(loop))
+            return
+
         loops = -1 if loop else 0
         self.channel = self.sound.play(loops=loops)
+        if self.channel is not None:
+            self.channel.set_volume(self.volume)
+
+    def resume(self, loop: bool) -> None:
+        if self.pending:
+            self.pending = False
+            if sound_bank.ready(self.path):
+                self.play(loop)
 
     def stop(self):
-        if self.channel:
+        self.pending = False
+        if self.playing():
             self.channel.stop()
+        self.channel = None
 
     def set_volume(self, volume: float):
-        self.sound.set_volume(volume)
+        self.volume = volume
+        if self.playing():
+            self.channel.set_volume(volume)
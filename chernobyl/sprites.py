@@ -0,0 +1,36 @@
+import math
+from typing import Dict, Tuple
+
+import pygame
+
+
+class SpriteCache:
+    """
+    Pre-rendered circle sprites keyed by ``(radius, color)``.
+
+    A sprite is rasterized once with ``pygame.draw.circle`` on a color-keyed
+    surface; drawing a particle afterwards is a plain blit.
+    """
+
+    def __init__(self) -> None:
+        self.sprites: Dict[Tuple[float, Tuple[int, int, int]], pygame.Surface] = {}
+
+    def circle(self, radius: float, color: Tuple[int, int, int]) -> pygame.Surface:
+        key = radius, tuple(color)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            size = max(int(math.ceil(2 * radius)), 1)
+            color_key = (255, 255, 255) if tuple(color) == (0, 0, 0) else (0, 0, 0)
+
+            sprite = pygame.Surface((size, size))
+            sprite.fill(color_key)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            sprite.set_colorkey(color_key, pygame.RLEACCEL)
+            self.sprites[key] = sprite
+        return sprite
+
+    def clear(self) -> None:
+        self.sprites.clear()
+
+
+sprite_cache = SpriteCache()
@@ -0,0 +1,39 @@
+import sys
+from time import perf_counter
+from typing import Dict
+
+STARTED = perf_counter()
+
+
+class StartupReport:
+    """
+    Milestones of a game start, in seconds since ``chernobyl`` was imported.
+
+    ``import`` is reached when the window module is loaded, ``init`` when
+    ``Window`` is constructed, ``first_frame`` once the menu is on screen and
+    ``interactive`` once the background warm-up of sounds and scenes is done.
+    """
+
+    MILESTONES = ("import", "init", "first_frame", "interactive")
+
+    def __init__(self, origin: float = STARTED) -> None:
+        self.origin = origin
+        self.marks: Dict[str, float] = {}
+
+    def mark(self, milestone: str) -> None:
+        self.marks.setdefault(milestone, perf_counter() - self.origin)
+
+    def reached(self, milestone: str) -> bool:
+        return milestone in self.marks
+
+    def as_dict(self) -> Dict[str, float]:
+        return {milestone: self.marks[milestone] * 1000 for milestone in self.MILESTONES if milestone in self.marks}
+
+    def format(self) -> str:
+        return "startup: " + ", ".join(f"{milestone} {ms:.1f} ms" for milestone, ms in self.as_dict().items())
+
+    def print(self) -> None:
+        print(self.format(), file=sys.stderr)
+
+
+startup_report = StartupReport()
@@ -1 +1,21 @@
+from importlib import import_module
+
 from .menu import Menu
+
+__all__ = ["Menu", "Reactor", "Board", "GameOver", "TimeOver", "Upgrader"]
+
+MODULES = {
+    "Reactor": ".reactor",
+    "Board": ".board",
+    "GameOver": ".game_over",
+    "TimeOver": ".time_over",
+    "Upgrader": ".upgrader",
+}
+
+
+def __getattr__(name):
+    # Only the menu is needed for the first frame; the other scenes are
+    # imported on first use or by the window's background warm-up.
+    if name in MODULES:
+        return getattr(import_module(MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
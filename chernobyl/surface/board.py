@@ -1,8 +1,10 @@
-import numpy as np
 import pygame
 
 from .surface import Surface
 from .. import V2D
+from ..font import font_cache
+from ..power import PowerLedger
+from ..timing import NULL_TIMER, PHASES
 
 
 class Board(Surface):
@@ -13,33 +15,10 @@ class Board(Surface):
 
         self.surface = pygame.Surface((self.screen.get_width(), 100))
         self.surface.fill(self.background_color)
-
-        self.time_left = 0
-        self.power = []
-        self.power_capacity = 0
-
-        self.menu_rect = None
-        self.timesup = False
-
-    import numpy as np
-
-    def downsample(self, values: list[float], target: int = 100) -> np.ndarray:
-        if len(values) <= target:
-            return np.asarray(values, dtype=float)
-
-        arr = np.asarray(values, dtype=float)
-
-        indices = np.linspace(0, len(arr), target + 1, dtype=int)
-
-        return np.array([
-            arr[indices[i]:indices[i + 1]].mean()
-            if indices[i] < indices[i + 1]
-            else arr[indices[i]]
-            for i in range(target)
-        ])
+        self.reset()
 
     def draw_power_graph(self):
-        values = self.downsample(self.power, 100)
+        values = self.power.history.values(100)
 
         if len(values) < 2:
             return
@@ -69,39 +48,72 @@ class Board(Surface):
         )
 
     def generated_power(self):
-        self.text(f"Generated power: {sum(self.power)} TW", V2D())
+        self.text(f"Generated power: {self.power.total} TW", V2D())
 
     def max_power(self):
         if len(self.power) > 0:
-            maximum_power = str(max(self.power))
+            maximum_power = str(self.power.peak)
         else:
             maximum_power = "NaN"
         self.text(f"Peak power: {maximum_power}/{self.power_capacity} TW", V2D(0, 32))
 
     def menu_button(self):
-        font_each_menu = pygame.font.SysFont(None, 32)
-        text = font_each_menu.render("Menu", True, self.foreground_color)
+        text = font_cache.render("Menu", 32, self.foreground_color)
         self.menu_rect = text.get_rect(
             center=(self.surface.get_width() // 2, 64)
         )
         self.surface.blit(text, self.menu_rect)
 
     def show_time_left(self):
-        font_each_menu = pygame.font.SysFont(None, 64)
-        text = font_each_menu.render(str(int(self.time_left)), True, self.foreground_color)
+        text = font_cache.render(str(int(self.time_left)), 64, self.foreground_color)
         rect = text.get_rect(
             center=(self.surface.get_width() // 2, 32)
         )
         self.surface.blit(text, rect)
         self.timesup = self.time_left < 0
 
-    def draw(self):
+    def reset(self) -> None:
+        self.time_left = 0
+        self.power = PowerLedger()
+        self.power_capacity = 0
+        self.timer = NULL_TIMER
+        self.menu_rect = None
+        self.timesup = False
+        self.shown = None
+
+    def timings(self):
+        if not self.timer.enabled:
+            return None
+
+        recent = self.timer.recent()
+        if not recent:
+            return None
+
+        phases = "  ".join(f"{phase} {recent[phase]:.1f}" for phase in PHASES)
+        return f"{phases} ms", f"atoms {recent['atom_count']:.0f}  neutrons {recent['neutron_count']:.0f}"
+
+    def timing_overlay(self, lines):
+        x = self.surface.get_width() // 2 + 80
+        for index, line in enumerate(lines):
+            self.text(line, V2D(x, 60 + 18 * index), font_size=18)
+
+    def draw(self, alpha: float = 1.0):
+        timings = self.timings()
+        shown = (id(self.power), self.power.total, self.power.peak, self.power.count, self.power_capacity,
+                 int(self.time_left), self.time_left < 0, self.surface.get_size(), timings)
+        if shown == self.shown:
+            return
+        self.shown = shown
+
+        self.mark_dirty()
         self.surface.fill(self.background_color)
         self.generated_power()
         self.show_time_left()
         self.max_power()
         self.draw_power_graph()
         self.menu_button()
+        if timings is not None:
+            self.timing_overlay(timings)
 
     def event_handler(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -1,16 +1,19 @@
-from random import random
+import threading
+from typing import Optional
 
 import numpy as np
 import pygame
 
-from .. import V2D, Sound
-from ..particle import Atom, Neutron, Rod
-from ..particle.particle import Particle
+from .. import Sound
+from ..particle.neutron import play_geiger_burst
+from ..simulation import ReactorSim
+from ..sprites import sprite_cache
 from ..surface.surface import Surface
+from ..utils import Fixer
 
 
 class Reactor(Surface):
-    def __init__(self, screen: pygame.Surface, x: int, y: int, dt: float) -> None:
+    def __init__(self, screen: pygame.Surface, x: int, y: int, dt: float, seed: Optional[int] = None) -> None:
         super().__init__(screen, x, y, dt)
         self.background_color = 28, 28, 28
         self.foreground_color = 255, 255, 255
@@ -19,190 +22,136 @@ class Reactor(Surface):
         self.paused = False
 
         self.background_sound = Sound("statics/sounds/silent-room.mp3")
-        self.background_sound.play(loop=True)
-
         self.background_sound_elect = Sound("statics/sounds/electricity.mp3", 0.2)
-        self.background_sound_elect.play(loop=True)
-
-        self.current_score = 0
-
-        self.available_clicks = 3
-        self.power_capacity = 4
-        self.total_power = 0
-
-        self.time_left = 10
-        self.critical_hit_probability = 0.5
-
-        self.neutron_velocity_mag = 250
-        self.neutron_release = 2.5
-
-        self.atom_capacity = 200
-        self.atom_velocity_mag = 100
-        self.atom_spawn_probability = 0.5
-        self.atom_decay_probability = 0.01
-        self.atom_attraction_strength = 0.0
-        self.atom_absorption_ratio = 0.25
-        self.atom_maximum_health = 4
-
-        self.power_surge = False
-
-        self.generated_power = []
-        self.atoms = []
-        self.neutrons = []
-        self.rods = [
-            Rod(self.surface, int(x), self.dt)
-            for x in np.linspace(100, self.surface.get_width() - 100, 10)
-        ]
-
-    def __del__(self):
-        try:
-            self.background_sound.stop()
-            self.background_sound_elect.stop()
-        except:
-            pass
-
-    def add_atom(self, atom: Atom) -> None:
-        self.atoms.append(atom)
 
-    def add_neutron(self, neutron: Neutron) -> None:
-        self.neutrons.append(neutron)
+        self.sim = ReactorSim(self.surface.get_width(), self.surface.get_height(), on_release=self.play_geiger,
+                              seed=seed)
+        self.palettes = {}
+        self.neutron_color = 0, 255, 0
+        self.static_layer = None
+        self.static_revisions = None
+        self.warm_sprites()
 
-    def add(self, particle: Particle) -> None:
-        if isinstance(particle, Neutron):
-            self.neutrons.append(particle)
-        elif isinstance(particle, Atom):
-            self.atoms.append(particle)
+    def enter(self) -> None:
+        for sound in (self.background_sound, self.background_sound_elect):
+            if not sound.playing():
+                sound.play(loop=True)
 
-    def calculate_atom_health(self, r: float = 1.5):
-        weights = [r ** (h - 1) for h in range(1, self.atom_maximum_health + 1)]
-        total = sum(weights)
+    def exit(self) -> None:
+        self.background_sound.stop()
+        self.background_sound_elect.stop()
 
-        roll = random()
-        cumulative = 0.0
-
-        for h, w in enumerate(weights, start=1):
-            cumulative += w / total
-            if roll <= cumulative:
-                return h
+    def reset(self, seed: Optional[int] = None) -> None:
+        self.paused = False
+        self.sim.reset(seed)
+
+    @property
+    def atoms(self):
+        return self.sim.atoms
+
+    @property
+    def neutrons(self):
+        return self.sim.neutrons
+
+    @property
+    def rods(self):
+        return self.sim.rods
+
+    @property
+    def limiters(self):
+        return self.sim.limiters
+
+    @property
+    def generated_power(self):
+        return self.sim.generated_power
+
+    @property
+    def total_power(self):
+        return self.sim.total_power
+
+    @property
+    def time_left(self):
+        return self.sim.time_left
+
+    @property
+    def power_capacity(self):
+        return self.sim.power_capacity
+
+    @property
+    def power_surge(self):
+        return self.sim.power_surge
+
+    def play_geiger(self, count: int) -> None:
+        threading.Thread(
+            target=play_geiger_burst,
+            args=(count,),
+            daemon=True
+        ).start()
+
+    def warm_sprites(self) -> None:
+        sprite_cache.circle(float(self.neutrons.default_radius), self.neutron_color)
+        for color in Fixer.colors(n=self.sim.atom_maximum_health):
+            sprite_cache.circle(float(self.atoms.default_radius), color)
+
+    def atom_colors(self) -> np.ndarray:
+        colors = np.zeros((len(self.atoms), 3), dtype=int)
+        for initial_health in np.unique(self.atoms.initial_health):
+            if initial_health not in self.palettes:
+                self.palettes[initial_health] = np.array(Fixer.colors(n=int(initial_health)))
+
+            same = self.atoms.initial_health == initial_health
+            colors[same] = self.palettes[initial_health][self.atoms.health[same] - 1]
+        return colors
+
+    def update(self):
+        if self.paused:
+            return
 
-        return self.atom_maximum_health
+        self.sim.step(self.dt)
 
-    def spawn_atom(self) -> None:
-        if random() > self.atom_spawn_probability:
-            return
+    def render_static_layer(self) -> pygame.Surface:
+        revisions = [absorber.revision for absorber in self.limiters + self.rods]
+        if self.static_layer is not None and revisions == self.static_revisions:
+            return self.static_layer
 
-        if len(self.atoms) >= self.atom_capacity:
-            return
+        if self.static_layer is None:
+            self.static_layer = pygame.Surface(self.surface.get_size())
+        self.static_layer.fill(self.background_color)
 
-        x = 10 + random() * (self.surface.get_width() - 10)
-        y = 10 + random() * (self.surface.get_height() - 10)
+        for rod in self.rods:
+            pygame.draw.line(self.static_layer, self.foreground_color,
+                             rod.start().as_tuple(), rod.end().as_tuple(), 10)
 
-        atom = Atom(self.surface, V2D(x, y), self.atom_maximum_health)
+        for limiter in self.limiters:
+            x0, y0, x1, y1 = limiter.bounds()
+            if x1 > x0 and y1 > y0:
+                pygame.draw.rect(self.static_layer, limiter.color, (x0, y0, x1 - x0, y1 - y0))
 
-        atom.decay_probability = self.atom_decay_probability
-        atom.attraction_strength = self.atom_attraction_strength
-        atom.absorption_ratio = self.atom_absorption_ratio
-        atom.velocity = V2D.random(magnitude=self.atom_velocity_mag)
-        self.add(atom)
+        self.static_revisions = revisions
+        return self.static_layer
 
-    def draw(self):
+    def draw(self, alpha: float = 1.0):
         if self.paused:
             return
-        self.time_left -= self.dt
-        power = 0
-        self.surface.fill(self.background_color)
-        for rod in self.rods:
-            self.line(rod.start(), rod.end(), width=10)
-            for neutron_index in range(len(self.neutrons) - 1, -1, -1):
-                neutron = self.neutrons[neutron_index]
-                if rod.collided(neutron):
-                    if random() > rod.absorption_ratio:
-                        del self.neutrons[neutron_index]
-
-        for atom_index in range(len(self.atoms) - 1, -1, -1):
-            atom = self.atoms[atom_index]
-
-            if atom.escaped():
-                del self.atoms[atom_index]
-                continue
-
-            if atom.is_dead():
-                for _ in range(int(atom.initial_health_point * self.neutron_release)):
-                    neutron = Neutron(self.surface, atom.position)
-                    neutron.velocity = V2D.random(magnitude=self.neutron_velocity_mag)
-                    self.add(neutron)
-
-                power += atom.initial_health_point
-                del self.atoms[atom_index]
-                continue
-
-            if atom.decay(self.dt):
-                power += atom.health_point / 2
-                for _ in range(int(atom.initial_health_point * self.neutron_release) // 2):
-                    neutron = Neutron(self.surface, atom.position)
-                    neutron.velocity = V2D.random(magnitude=self.neutron_velocity_mag)
-                    self.add(neutron)
-
-                power += atom.initial_health_point // 2
-                del self.atoms[atom_index]
-                continue
-
-            atom.move(self.dt)
-            self.circle(atom.position, atom.radius, atom.color)
-
-        for neutron_index in range(len(self.neutrons) - 1, -1, -1):
-            skip = False
-            neutron = self.neutrons[neutron_index]
-
-            if neutron.escaped() or neutron.end_of_life():
-                del self.neutrons[neutron_index]
-                continue
-
-            for atom_index in range(len(self.atoms) - 1, -1, -1):
-                atom = self.atoms[atom_index]
-                if atom.collided(neutron):
-                    if atom.absorbed(self.dt):
-                        critical_multiplier = 1 if self.critical_hit_probability > random() else 2
-                        atom.health_point -= int(
-                            neutron.health_point + np.log10(neutron.velocity.mag() // 3)) * critical_multiplier
-
-                    atom.bounce(neutron)
-                    del self.neutrons[neutron_index]
-                    skip = True
-                    break
-            if skip:
-                continue
-
-            neutron.move(self.dt)
-            self.circle(neutron.position, neutron.radius, neutron.color)
-
-        self.power_surge = power > self.power_capacity
-
-        self.total_power += power
-        if power > 0:
-            self.generated_power.append(int(power))
-
-        self.spawn_atom()
+
+        start = self.sim.timer.clock()
+        self.surface.blit(self.render_static_layer(), (0, 0))
+        # Atoms that died during the last step are only removed by the next one.
+        living = self.atoms.health > 0
+        self.circles(self.atoms.interpolate(alpha)[living], self.atoms.radius[living], self.atom_colors()[living])
+        self.circles(self.neutrons.interpolate(alpha), self.neutrons.radius, self.neutron_color)
+        self.mark_dirty()
+        self.sim.timer.add("render", start)
 
     def event_handler(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            mouse = V2D(*event.pos)
-
-            for atom_index in range(len(self.atoms) - 1, -1, -1):
-                atom = self.atoms[atom_index]
-                x, y = mouse
-                if atom.position.dist(V2D(x, y - 100)) < atom.radius:
-                    for _ in range(int(atom.initial_health_point * self.neutron_release)):
-                        neutron = Neutron(self.surface, atom.position)
-                        neutron.velocity = V2D.random(magnitude=self.neutron_velocity_mag)
-                        self.add(neutron)
-                    del self.atoms[atom_index]
-                    break
+            x, y = event.pos
+            self.sim.click((x - self.x, y - self.y))
         elif event.type == pygame.MOUSEWHEEL:
             if event.y > 0:
-                for rod in self.rods:
-                    rod.lift()
+                self.sim.lift_rods()
 
             elif event.y < 0:
-                for rod in self.rods:
-                    rod.lower()
+                self.sim.lower_rods()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.sim.profile(not self.sim.timer.enabled)
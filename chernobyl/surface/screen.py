@@ -0,0 +1,111 @@
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from .surface import Surface
+from ..font import font_cache
+from ..sound import Sound
+
+
+class MenuScreen(Surface):
+    """
+    Full-screen menu laid out once and redrawn only when something changes.
+
+    Subclasses draw their static content in ``layout`` and return the rect of
+    every clickable item. The result is kept as a static layer plus a rect
+    table until the window size changes; hovering and clicking only look
+    rects up in that table.
+    """
+
+    interactive = True
+
+    def __init__(self, screen: pygame.Surface, x: int, y: int, dt: float, paused: bool = False) -> None:
+        super().__init__(screen, x, y, dt)
+        self.background_color = 227, 227, 227
+        self.foreground_color = 0, 0, 0
+        self.surface.fill(self.background_color)
+        self.paused = paused
+        self.hovered_item = None
+
+        self.static_layer = None
+        self.layout_size = None
+        self.rects: Dict[str, pygame.Rect] = {}
+        self.dirty = True
+
+        self.background_sound = Sound("statics/sounds/spooky.mp3")
+
+        self.sounds = {
+            "click": Sound("statics/sounds/click.mp3"),
+            "hover": Sound("statics/sounds/hover.mp3"),
+        }
+
+    def enter(self) -> None:
+        if not self.background_sound.playing():
+            self.background_sound.play(loop=True)
+
+    def exit(self) -> None:
+        self.background_sound.stop()
+
+    def reset(self) -> None:
+        self.hovered_item = None
+        self.layout_size = None
+
+    def layout(self, layer: pygame.Surface) -> Dict[str, pygame.Rect]:
+        return {}
+
+    def blit_centered(self, layer: pygame.Surface, text: str, size: int, center: Tuple[int, int]) -> pygame.Rect:
+        rendered = font_cache.render(text, size, self.foreground_color)
+        rect = rendered.get_rect(center=center)
+        layer.blit(rendered, rect)
+        return rect
+
+    def items(self) -> Dict[str, pygame.Rect]:
+        size = self.screen.get_size()
+        if size != self.layout_size:
+            if self.surface.get_size() != size:
+                self.surface = pygame.Surface(size)
+
+            self.static_layer = pygame.Surface(size)
+            self.static_layer.fill(self.background_color)
+            self.rects = self.layout(self.static_layer)
+            self.layout_size = size
+            self.dirty = True
+
+        return self.rects
+
+    def item_at(self, position: Tuple[int, int]) -> Optional[str]:
+        for name, rect in self.items().items():
+            if rect.collidepoint(position):
+                return name
+        return None
+
+    def hover_handler(self):
+        if not self.interactive:
+            return
+
+        current_hover = self.item_at(pygame.mouse.get_pos())
+        if current_hover != self.hovered_item:
+            if current_hover is not None:
+                self.sounds["hover"].play()
+            self.dirty = True
+
+        self.hovered_item = current_hover
+
+    def event_handler(self, event):
+        if not self.interactive:
+            return
+
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            name = self.item_at(event.pos)
+            if name is not None:
+                self.sounds["click"].play()
+                return name
+
+    def draw(self, alpha: float = 1.0):
+        self.items()
+        if not self.dirty:
+            return
+
+        self.surface.blit(self.static_layer, (0, 0))
+        self.mark_dirty()
+        self.dirty = False
@@ -1,7 +1,10 @@
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
+import numpy as np
 import pygame
 
+from ..font import font_cache
+from ..sprites import sprite_cache
 from ..v2d import V2D
 
 
@@ -16,6 +19,12 @@ class Surface:
         self.background_color = 62, 62, 62
         self.foreground_color = 0, 0, 0
         self.surface.fill(self.background_color)
+        self.dirty_rects: List[pygame.Rect] = []
+
+    def mark_dirty(self, rect: Optional[pygame.Rect] = None) -> None:
+        if rect is None:
+            rect = self.surface.get_rect()
+        self.dirty_rects.append(pygame.Rect(rect))
 
     def text(self, text: str, position: V2D, color: Optional[Tuple[int, int, int]] = None, font_size: int = 48) -> None:
         if color is None:
@@ -23,8 +32,7 @@ class Surface:
         else:
             the_color = color
 
-        font = pygame.font.Font(None, font_size)
-        text_surface = font.render(text, True, the_color)
+        text_surface = font_cache.render(text, font_size, the_color)
         self.surface.blit(text_surface, position.as_tuple())
 
     def circle(self, position: V2D, radius: float, color: Optional[Tuple[int, int, int]] = None) -> None:
@@ -40,6 +48,37 @@ class Surface:
             radius
         )
 
+    def circles(self, positions: np.ndarray, radii: np.ndarray,
+                colors: Union[Tuple[int, int, int], np.ndarray]) -> None:
+        """
+        Draw many filled circles with one batched blit of cached sprites.
+
+        Args:
+            positions (np.ndarray): ``(n, 2)`` circle centers.
+            radii (np.ndarray): Radius of every circle.
+            colors: One color for all circles or an ``(n, 3)`` array of colors.
+        """
+        if len(positions) == 0:
+            return
+
+        corners = np.floor(positions - radii[:, None]).astype(int).tolist()
+        colors = np.asarray(colors)
+        if colors.ndim == 1 and np.all(radii == radii[0]):
+            sprites = [sprite_cache.circle(float(radii[0]), tuple(colors.tolist()))] * len(positions)
+        else:
+            keys, inverse = np.unique(np.column_stack([radii, np.broadcast_to(colors, (len(positions), 3))]),
+                                      axis=0, return_inverse=True)
+            table = np.empty(len(keys), dtype=object)
+            for index, (radius, *color) in enumerate(keys.tolist()):
+                table[index] = sprite_cache.circle(radius, tuple(int(channel) for channel in color))
+            sprites = table[inverse.ravel()]
+
+        blits = getattr(self.surface, "fblits", None)
+        if blits is not None:
+            blits(zip(sprites, corners))
+        else:
+            self.surface.blits(zip(sprites, corners), doreturn=False)
+
     def line(self, start: V2D, end: V2D, color: Optional[Tuple[int, int, int]] = None, width: int = 1) -> None:
         if color is None:
             the_color = self.foreground_color
@@ -55,6 +94,14 @@ class Surface:
         )
 
 
+    def enter(self) -> None:
+        pass
+
+    def exit(self) -> None:
+        pass
+
+    def reset(self) -> None:
+        pass
 
     def hover_handler(self):
         pass
@@ -62,5 +109,8 @@ class Surface:
     def event_handler(self, event):
         pass
 
-    def draw(self):
+    def update(self):
+        pass
+
+    def draw(self, alpha: float = 1.0):
         pass
\ No newline at end of file
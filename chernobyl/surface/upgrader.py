@@ -2,50 +2,25 @@ from typing import Dict
 
 import pygame
 
-from .surface import Surface
-from ..sound import Sound
+from .screen import MenuScreen
+from ..font import font_cache
 
 
-class Upgrader(Surface):
-    def __init__(self, screen: pygame.Surface, x: int, y: int, dt: float, paused: bool = False) -> None:
-        super().__init__(screen, x, y, dt)
-        self.background_color = 227, 227, 227
-        self.foreground_color = 0, 0, 0
-        self.surface.fill(self.background_color)
-        self.paused = paused
-        self.hovered_item = None
+class Upgrader(MenuScreen):
+    interactive = False
 
-        self.background_sound = Sound("statics/sounds/spooky.mp3")
-        self.background_sound.play(loop=True)
-
-        self.sounds = {
-            "click": Sound("statics/sounds/click.mp3"),
-            "hover": Sound("statics/sounds/hover.mp3"),
-        }
-
-    def __del__(self):
-        try:
-            self.background_sound.stop()
-        except:
-            pass
-
-    def draw(self):
-        self.items()
-
-    def items(self) -> Dict[str, pygame.Rect]:
+    def layout(self, layer: pygame.Surface) -> Dict[str, pygame.Rect]:
         grid: Dict[str, pygame.Rect] = {}
 
         rows = cols = 10
         padding = 8
         gap = 4
 
-        width, height = self.surface.get_size()
+        width, height = layer.get_size()
 
         cell_width = (width - 2 * padding - (cols - 1) * gap) // cols
         cell_height = (height - 2 * padding - (rows - 1) * gap) // rows
 
-        font = pygame.font.SysFont(None, 16)
-
         index = 0
         for row in range(rows):
             for col in range(cols):
@@ -56,13 +31,13 @@ class Upgrader(Surface):
 
                 color = (200, 200, 200) if (row + col) % 2 == 0 else (180, 180, 180)
 
-                pygame.draw.rect(self.surface, color, rect, border_radius=4)
-                pygame.draw.rect(self.surface, (120, 120, 120), rect, 1, border_radius=4)
+                pygame.draw.rect(layer, color, rect, border_radius=4)
+                pygame.draw.rect(layer, (120, 120, 120), rect, 1, border_radius=4)
 
                 label = f"Item {index}"
-                text = font.render(label, True, self.foreground_color)
+                text = font_cache.render(label, 16, self.foreground_color)
                 text_rect = text.get_rect(center=rect.center)
-                self.surface.blit(text, text_rect)
+                layer.blit(text, text_rect)
 
                 grid[label] = rect
                 index += 1
@@ -0,0 +1,180 @@
+import argparse
+import itertools
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .simulation import ReactorSim
+
+TUNABLES = ("neutron_release", "neutron_velocity_mag", "atom_capacity", "atom_spawn_probability",
+            "atom_decay_probability", "critical_hit_probability", "power_capacity", "atom_attraction_strength",
+            "insertion")
+
+
+def grid(**values: Sequence[float]) -> List[Dict[str, float]]:
+    """Every combination of the given tunable values, e.g. ``grid(neutron_release=[2, 3], insertion=[0, 0.5])``."""
+    unknown = set(values) - set(TUNABLES)
+    if unknown:
+        raise ValueError(f"Unknown tunable(s): {', '.join(sorted(unknown))}")
+
+    names = list(values)
+    return [dict(zip(names, combination)) for combination in itertools.product(*values.values())]
+
+
+def configure(sim: ReactorSim, params: Dict[str, float]) -> None:
+    for name, value in params.items():
+        if name == "insertion":
+            for rod in sim.rods:
+                rod.insertion = value
+        else:
+            setattr(sim, name, value)
+
+
+def session(params: Dict[str, float], seed: int, duration: float = 10.0, width: int = 1200, height: int = 680,
+            simulation_rate: int = 60) -> dict:
+    """Play one headless reactor session without input until it surges or runs out of time."""
+    sim = ReactorSim(width, height, seed=seed)
+    configure(sim, params)
+    sim.time_left = duration
+
+    dt = 1.0 / simulation_rate
+    step_times = []
+    peak_neutrons = 0
+    while sim.time_left >= 0 and not sim.power_surge:
+        start = perf_counter()
+        sim.step(dt)
+        step_times.append(perf_counter() - start)
+        peak_neutrons = max(peak_neutrons, len(sim.neutrons))
+
+    return {
+        "total_power": float(sim.total_power),
+        "surged": sim.power_surge,
+        "steps": len(step_times),
+        "peak_neutrons": peak_neutrons,
+        "step_ms": float(np.mean(step_times) * 1000) if step_times else 0.0,
+    }
+
+
+def repeat_seeds(seed: np.random.SeedSequence, repeats: int) -> List[int]:
+    return [int(child.generate_state(1)[0]) for child in seed.spawn(repeats)]
+
+
+def aggregate(params: Dict[str, float], sessions: List[dict]) -> dict:
+    """Summarize the sessions of one parameter point."""
+    power = np.array([result["total_power"] for result in sessions])
+    step_ms = np.array([result["step_ms"] for result in sessions])
+    return {
+        "params": params,
+        "repeats": len(sessions),
+        "total_power_mean": float(power.mean()),
+        "total_power_std": float(power.std()),
+        "surge_rate": float(np.mean([result["surged"] for result in sessions])),
+        "peak_neutrons": int(max(result["peak_neutrons"] for result in sessions)),
+        "steps_mean": float(np.mean([result["steps"] for result in sessions])),
+        "step_ms_mean": float(step_ms.mean()),
+        "step_ms_max": float(step_ms.max()),
+    }
+
+
+def evaluate(params: Dict[str, float], seed: np.random.SeedSequence, repeats: int, **options) -> dict:
+    """Run ``repeats`` sessions of one parameter point in this process and aggregate them."""
+    return aggregate(params, [session(params, session_seed, **options)
+                              for session_seed in repeat_seeds(seed, repeats)])
+
+
+def sweep(points: Iterable[Dict[str, float]], output: Optional[str] = None, repeats: int = 4, seed: int = 0,
+          workers: Optional[int] = None, on_result: Optional[Callable[[dict], None]] = None,
+          **options) -> List[dict]:
+    """
+    Evaluate parameter points on a process pool.
+
+    Every session is its own task, so even a single point with a few
+    repeats keeps every worker busy. Every point gets its own child of
+    ``SeedSequence(seed)``, and every session of a point a child of that, so
+    the streams are independent and a sweep is reproducible whatever the
+    number of workers. A point is aggregated as soon as its last session
+    finishes and appended to ``output`` as a JSON line, in completion order.
+
+    Args:
+        points: Parameter dicts, see ``grid``.
+        output (Optional[str]): JSON lines file to stream the results to.
+        repeats (int): Sessions per point.
+        seed (int): Root seed of the sweep.
+        workers (Optional[int]): Worker processes. Defaults to every core.
+        on_result: Called with every result as it arrives.
+        **options: Passed to ``session``.
+
+    Returns:
+        List[dict]: Aggregated result of every point, in completion order.
+    """
+    points = list(points)
+    seeds = np.random.SeedSequence(seed).spawn(len(points))
+    sessions: List[List[Optional[dict]]] = [[None] * repeats for _ in points]
+    remaining = [repeats] * len(points)
+    results = []
+
+    stream = open(output, "a") if output is not None else None
+    try:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            futures = {
+                pool.submit(session, params, session_seed, **options): (point, repeat)
+                for point, (params, point_seed) in enumerate(zip(points, seeds))
+                for repeat, session_seed in enumerate(repeat_seeds(point_seed, repeats))
+            }
+            for future in as_completed(futures):
+                point, repeat = futures[future]
+                sessions[point][repeat] = future.result()
+                remaining[point] -= 1
+                if remaining[point] > 0:
+                    continue
+
+                result = aggregate(points[point], sessions[point])
+                results.append(result)
+                if stream is not None:
+                    stream.write(json.dumps(result) + "\n")
+                    stream.flush()
+                if on_result is not None:
+                    on_result(result)
+    finally:
+        if stream is not None:
+            stream.close()
+
+    return results
+
+
+def parse_param(text: str):
+    name, _, values = text.partition("=")
+    return name, [float(value) for value in values.split(",")]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m chernobyl.sweep", description="Sweep reactor tunables.")
+    parser.add_argument("--param", action="append", type=parse_param, default=[],
+                        help=f"name=v1,v2,... with name one of {', '.join(TUNABLES)}")
+    parser.add_argument("--repeats", type=int, default=4, help="Sessions per parameter point")
+    parser.add_argument("--seed", type=int, default=0, help="Root seed of the sweep")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: all cores)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Session length in seconds")
+    parser.add_argument("--output", help="JSON lines file to append the results to (default: stdout)")
+    args = parser.parse_args()
+
+    try:
+        points = grid(**dict(args.param))
+    except ValueError as error:
+        parser.error(str(error))
+
+    start = perf_counter()
+    results = sweep(points, args.output, repeats=args.repeats, seed=args.seed, workers=args.workers,
+                    on_result=None if args.output else lambda result: print(json.dumps(result), flush=True),
+                    duration=args.duration)
+    print(f"{len(results)} points in {perf_counter() - start:.1f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
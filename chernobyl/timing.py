@@ -0,0 +1,112 @@
+import csv
+import json
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, List, Union
+
+import numpy as np
+
+PHASES = ("absorb", "atoms", "neutrons", "spawn", "render")
+COUNTS = ("atom_count", "neutron_count")
+
+
+class NullTimer:
+    """Timer that records nothing, so disabled timing costs a few no-op calls per frame."""
+
+    enabled = False
+
+    def begin(self) -> None:
+        pass
+
+    def lap(self, phase: str) -> None:
+        pass
+
+    def end(self, atoms: int, neutrons: int) -> None:
+        pass
+
+    def clock(self) -> float:
+        return 0.0
+
+    def add(self, phase: str, since: float) -> None:
+        pass
+
+
+class FrameTimer(NullTimer):
+    """
+    Wall time of every phase of the last ``capacity`` simulation steps.
+
+    ``ReactorSim.step`` calls ``begin``, ``lap`` after each phase and
+    ``end`` with the particle counts; the renderer adds its draw time to the
+    latest step with ``clock``/``add``. Samples live in a ring buffer of
+    seconds, so recording a frame allocates nothing.
+    """
+
+    enabled = True
+
+    def __init__(self, capacity: int = 3600) -> None:
+        self.capacity = capacity
+        self.index = {phase: column for column, phase in enumerate(PHASES)}
+        self.samples = np.zeros((capacity, len(PHASES)), dtype=float)
+        self.counts = np.zeros((capacity, len(COUNTS)), dtype=int)
+        self.frames = 0
+        self.last = 0.0
+
+    def __len__(self) -> int:
+        return min(self.frames, self.capacity)
+
+    def begin(self) -> None:
+        self.samples[self.frames % self.capacity] = 0
+        self.last = perf_counter()
+
+    def lap(self, phase: str) -> None:
+        now = perf_counter()
+        self.samples[self.frames % self.capacity, self.index[phase]] += now - self.last
+        self.last = now
+
+    def end(self, atoms: int, neutrons: int) -> None:
+        self.counts[self.frames % self.capacity] = atoms, neutrons
+        self.frames += 1
+
+    def clock(self) -> float:
+        return perf_counter()
+
+    def add(self, phase: str, since: float) -> None:
+        if self.frames > 0:
+            self.samples[(self.frames - 1) % self.capacity, self.index[phase]] += perf_counter() - since
+
+    def recent(self, frames: int = 60) -> Dict[str, float]:
+        """Mean milliseconds per phase and mean particle counts of the last ``frames`` steps."""
+        frames = min(frames, len(self))
+        if frames == 0:
+            return {}
+
+        rows = np.arange(self.frames - frames, self.frames) % self.capacity
+        summary = dict(zip(PHASES, (self.samples[rows].mean(axis=0) * 1000).tolist()))
+        summary.update(zip(COUNTS, self.counts[rows].mean(axis=0).tolist()))
+        return summary
+
+    def rows(self) -> List[dict]:
+        rows = []
+        for frame in range(self.frames - len(self), self.frames):
+            row = {"frame": frame}
+            row.update(zip((f"{phase}_ms" for phase in PHASES),
+                           (self.samples[frame % self.capacity] * 1000).tolist()))
+            row.update(zip(COUNTS, self.counts[frame % self.capacity].tolist()))
+            rows.append(row)
+        return rows
+
+    def export(self, path: Union[str, Path]) -> None:
+        """Write the recorded frames as JSON when ``path`` ends in ``.json``, as CSV otherwise."""
+        path = Path(path)
+        rows = self.rows()
+        if path.suffix == ".json":
+            path.write_text(json.dumps(rows, indent=2))
+            return
+
+        with path.open("w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=["frame"] + [f"{phase}_ms" for phase in PHASES] + list(COUNTS))
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+NULL_TIMER = NullTimer()
@@ -1,4 +1,5 @@
-from typing import Optional, List, Tuple
+from functools import lru_cache
+from typing import Optional, Tuple
 
 import numpy as np
 
@@ -16,14 +17,15 @@ class Fixer:
         return vector
 
     @staticmethod
-    def colors(n: int = 20) -> List[Tuple[int, int, int]]:
+    @lru_cache(maxsize=None)
+    def colors(n: int = 20) -> Tuple[Tuple[int, int, int], ...]:
         colors = []
         for i in range(n):
             r = int((i / (n - 1)) * 255)
             g = 0
             b = int((1 - i / (n - 1)) * 255)
             colors.append((r, g, b))
-        return colors
+        return tuple(colors)
 
     @classmethod
     def fps(cls, value: Optional[int] = None) -> float:
@@ -1,4 +1,5 @@
-from random import random
+import math
+from numbers import Real
 
 import numpy as np
 from typing import Optional, Union, Tuple
@@ -6,12 +7,16 @@ from typing import Optional, Union, Tuple
 
 class V2D:
     """
-    A 2D vector class using NumPy for fast operations.
+    A 2D vector class stored as a pair of plain floats.
 
     Supports vector arithmetic, polar coordinates, rotation, magnitude,
     unit vector, dot product, angle calculation, and parallel/perpendicular checks.
+    The in-place operators (``+=``, ``-=``, ``*=``, ``/=``) mutate the vector
+    instead of allocating a new one.
     """
 
+    __slots__ = ("x", "y")
+
     def __init__(self, x: float = 0, y: float = 0) -> None:
         """
         Initialize a 2D vector.
@@ -20,17 +25,13 @@ class V2D:
             x (float): X component of the vector.
             y (float): Y component of the vector.
         """
-        self.vec = np.array([x, y], dtype=float)
-
-    @property
-    def x(self) -> float:
-        """Return the x component of the vector."""
-        return self.vec[0]
+        self.x = float(x)
+        self.y = float(y)
 
     @property
-    def y(self) -> float:
-        """Return the y component of the vector."""
-        return self.vec[1]
+    def vec(self) -> np.ndarray:
+        """Return the vector as a NumPy array."""
+        return np.array([self.x, self.y], dtype=float)
 
     def __repr__(self) -> str:
         """Return a detailed string representation of the vector."""
@@ -42,20 +43,20 @@ class V2D:
 
     def __iter__(self):
         """Allow unpacking of the vector: x, y = vector"""
-        return iter(self.vec)
+        return iter((self.x, self.y))
 
     # Arithmetic operators
     def __add__(self, other: "V2D") -> "V2D":
         """Add two vectors."""
-        return V2D(*(self.vec + other.vec))
+        return V2D(self.x + other.x, self.y + other.y)
 
     def __sub__(self, other: "V2D") -> "V2D":
         """Subtract another vector from this vector."""
-        return V2D(*(self.vec - other.vec))
+        return V2D(self.x - other.x, self.y - other.y)
 
     def __neg__(self) -> "V2D":
         """Return the negation of the vector."""
-        return V2D(*(-self.vec))
+        return V2D(-self.x, -self.y)
 
     def __mul__(self, other: Union[float, "V2D"]) -> "V2D":
         """
@@ -64,8 +65,8 @@ class V2D:
         Raises:
             TypeError: If multiplying by a non-scalar.
         """
-        if isinstance(other, (int, float)):
-            return V2D(*(self.vec * other))
+        if isinstance(other, Real):
+            return V2D(self.x * other, self.y * other)
         raise TypeError("2D vector can only multiply by a scalar")
 
     def __rmul__(self, scalar: float) -> "V2D":
@@ -81,7 +82,46 @@ class V2D:
         """
         if scalar == 0:
             raise ValueError("Cannot divide by zero")
-        return V2D(*(self.vec / scalar))
+        return V2D(self.x / scalar, self.y / scalar)
+
+    # In-place operators
+    def __iadd__(self, other: "V2D") -> "V2D":
+        """Add another vector to this vector in place."""
+        self.x += other.x
+        self.y += other.y
+        return self
+
+    def __isub__(self, other: "V2D") -> "V2D":
+        """Subtract another vector from this vector in place."""
+        self.x -= other.x
+        self.y -= other.y
+        return self
+
+    def __imul__(self, other: float) -> "V2D":
+        """
+        Multiply the vector by a scalar in place.
+
+        Raises:
+            TypeError: If multiplying by a non-scalar.
+        """
+        if isinstance(other, Real):
+            self.x *= other
+            self.y *= other
+            return self
+        raise TypeError("2D vector can only multiply by a scalar")
+
+    def __itruediv__(self, scalar: float) -> "V2D":
+        """
+        Divide the vector by a scalar in place.
+
+        Raises:
+            ValueError: If scalar is zero.
+        """
+        if scalar == 0:
+            raise ValueError("Cannot divide by zero")
+        self.x /= scalar
+        self.y /= scalar
+        return self
 
     def __eq__(self, other: "V2D") -> bool:
         """Check if two vectors are approximately equal."""
@@ -90,7 +130,7 @@ class V2D:
     # Copy
     def copy(self) -> "V2D":
         """Return a copy of the vector."""
-        return V2D(*self.vec)
+        return V2D(self.x, self.y)
 
     # Random vector
     @classmethod
@@ -127,15 +167,15 @@ class V2D:
         angle = angle_deg
         if random_angle != 0:
             angle += np.random.uniform(-random_angle, random_angle)
-        rad = np.radians(angle)
-        x = magnitude * np.cos(rad)
-        y = magnitude * np.sin(rad)
+        rad = math.radians(angle)
+        x = magnitude * math.cos(rad)
+        y = magnitude * math.sin(rad)
         return cls(x, y)
 
     # Magnitude
     def mag(self) -> float:
         """Return the magnitude (length) of the vector."""
-        return np.linalg.norm(self.vec)
+        return math.hypot(self.x, self.y)
 
     # Distance
     def dist(self, other: Optional["V2D"] = None) -> float:
@@ -149,8 +189,8 @@ class V2D:
             float: Euclidean distance.
         """
         if other is None:
-            other = V2D()
-        return np.linalg.norm(self.vec - other.vec)
+            return math.hypot(self.x, self.y)
+        return math.hypot(self.x - other.x, self.y - other.y)
 
     # Unit vector
     def unit(self) -> "V2D":
@@ -171,7 +211,7 @@ class V2D:
     # Dot product
     def dot(self, other: "V2D") -> float:
         """Return the dot product with another vector."""
-        return float(np.dot(self.vec, other.vec))
+        return self.x * other.x + self.y * other.y
 
     # Angle between vectors in degrees
     def angle_between(self, other: "V2D") -> float:
@@ -186,8 +226,8 @@ class V2D:
         """
         if self.mag() == 0 or other.mag() == 0:
             raise ValueError("Cannot compute angle with zero vector")
-        cos_angle = np.clip(self.dot(other) / (self.mag() * other.mag()), -1.0, 1.0)
-        return np.degrees(np.arccos(cos_angle))
+        cos_angle = min(max(self.dot(other) / (self.mag() * other.mag()), -1.0), 1.0)
+        return math.degrees(math.acos(cos_angle))
 
     # Parallel/perpendicular checks
     def is_parallel(self, other: "V2D", tolerance: float = 1e-6) -> bool:
@@ -229,10 +269,10 @@ class V2D:
         Returns:
             V2D: Rotated vector.
         """
-        rad = np.radians(angle)
-        cos_a = np.cos(rad)
-        sin_a = np.sin(rad)
-        x, y = self.vec
+        rad = math.radians(angle)
+        cos_a = math.cos(rad)
+        sin_a = math.sin(rad)
+        x, y = self.x, self.y
         return V2D(x * cos_a - y * sin_a, x * sin_a + y * cos_a)
 
     # Output as tuple
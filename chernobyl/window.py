@@ -1,20 +1,37 @@
-from typing import Optional
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
 
+import numpy as np
 import pygame
 
+from . import surface as screens
+from .compositor import Compositor
+from .rng import session_seeds
+from .scenes import SceneManager
+from .sound import SOUNDS_DIRECTORY, sound_bank
+from .startup import startup_report
 from .surface import Menu
-from .surface.board import Board
-from .surface.game_over import GameOver
-from .surface.reactor import Reactor
-from .surface.time_over import TimeOver
-from .surface.upgrader import Upgrader
 from .utils import Fixer
 
+if TYPE_CHECKING:
+    from .surface.reactor import Reactor
+
+MENU_SOUNDS = [SOUNDS_DIRECTORY / name for name in ("spooky.mp3", "click.mp3", "hover.mp3")]
+
 
 class Window:
     def __init__(self, width: int, height: int, title: str = "Chernobyl", full_screen: bool = True,
-                 fps: Optional[int] = None):
-        pygame.init()
+                 fps: Optional[int] = None, simulation_rate: int = 60, max_substeps: int = 5,
+                 seed: Optional[int] = None, record: Optional[Union[str, Path]] = None,
+                 profile: Optional[Union[str, Path]] = None, report_startup: bool = False):
+        # Only what the menu needs; the mixer is started by the sound warm-up.
+        pygame.display.init()
+        pygame.font.init()
+        sound_bank.preload(background=True, first=MENU_SOUNDS)
+        self.warm_up = threading.Thread(target=self.import_scenes, daemon=True)
+        self.warm_up.start()
+        self.report_startup = report_startup
 
         self.width = width
         self.height = height
@@ -26,15 +43,33 @@ class Window:
         self.level = 1
 
         self.clock = pygame.time.Clock()
-        self.dt = self.clock.tick(self.fps) / 1000.0
+        self.simulation_rate = simulation_rate
+        self.max_substeps = max_substeps
+        self.dt = 1.0 / self.simulation_rate
+        self.tick = 0
+
+        self.seed = seed
+        self.entropy = None
+        self.seeds = None
 
         self.screen = pygame.display.set_mode((self.width, self.height), self.flags)
         pygame.display.set_caption(self.title)
+        self.compositor = Compositor(self.screen)
 
-        self.hovered_item = None
+        self.profile = profile
+
+        self.record = record
+        self.recording = None
+        if record is not None:
+            from .replay import Recording
 
+            width, height = self.screen.get_size()
+            self.recording = Recording(self.session_entropy(), self.simulation_rate, width, height - 100)
 
-        self.menu_surface = Menu(self.screen, 0, 0, self.dt)
+        self.hovered_item = None
+
+        self.scenes = SceneManager(self.screen, self.dt)
+        self.menu_surface = self.menu()
         self.game_over_surface = None
         self.upgrade_surface = None
         self.reactor_surface = None
@@ -45,41 +80,104 @@ class Window:
         self.available_power = 0
 
         self.running = True
+        self.scenes.show(self.surfaces())
+        startup_report.mark("init")
+
+    @staticmethod
+    def import_scenes():
+        for name in screens.__all__:
+            getattr(screens, name)
+
+    def session_entropy(self) -> int:
+        if self.entropy is None:
+            self.entropy = np.random.SeedSequence(self.seed).entropy
+        return self.entropy
+
+    def next_seed(self) -> int:
+        if self.seeds is None:
+            self.seeds = session_seeds(self.session_entropy())
+        return next(self.seeds)
+
+    def interactive(self) -> bool:
+        return not (self.warm_up.is_alive() or sound_bank.loading())
 
     def stop(self):
         self.running = False
 
-    def draw(self):
-        for surface in [self.menu_surface, self.reactor_surface, self.board_surface, self.game_over_surface]:
-            if surface is not None:
-                self.screen.blit(surface.surface, (surface.x, surface.y))
+    def surfaces(self):
+        return [
+            surface
+            for surface in [self.menu_surface, self.reactor_surface, self.board_surface, self.game_over_surface]
+            if surface is not None
+        ]
+
+    def scene(self, kind):
+        scene = self.scenes.get(kind)
+        scene.reset()
+        return scene
+
+    def menu(self, paused: bool = False) -> Menu:
+        menu = self.scenes.get(Menu)
+        menu.paused = paused
+        menu.reset()
+        return menu
+
+    def new_reactor(self) -> "Reactor":
+        reactor = self.scenes.get(screens.Reactor, 0, 100)
+        reactor.reset(seed=self.next_seed())
+        if self.profile is not None:
+            reactor.sim.profile()
+        return reactor
+
+    def record_event(self, event):
+        if self.recording is None or self.reactor_surface is None:
+            return
+
+        reactor = self.reactor_surface
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            x, y = event.pos
+            self.recording.click(self.tick, x - reactor.x, y - reactor.y)
+        elif event.type == pygame.MOUSEWHEEL and event.y != 0:
+            self.recording.wheel(self.tick, 1 if event.y > 0 else -1)
+
+    def update(self):
+        self.tick += 1
+        for surface in self.surfaces():
+            surface.update()
 
         if not None in [self.board_surface, self.reactor_surface]:
             self.board_surface.power = self.reactor_surface.generated_power
             self.board_surface.time_left = self.reactor_surface.time_left
             self.board_surface.power_capacity = self.reactor_surface.power_capacity
+            self.board_surface.timer = self.reactor_surface.sim.timer
             if self.reactor_surface.power_surge:
-                self.available_power += int(sum(self.reactor_surface.generated_power)) // 2
+                self.available_power += int(self.reactor_surface.generated_power.total) // 2
                 self.reactor_surface = None
                 self.board_surface = None
-                self.game_over_surface = GameOver(self.screen, 0, 0, self.dt)
+                self.game_over_surface = self.scene(screens.GameOver)
 
-            elif self.board_surface.timesup:
-                self.available_power += int(sum(self.reactor_surface.generated_power))
+            elif self.reactor_surface.time_left < 0:
+                self.available_power += int(self.reactor_surface.generated_power.total)
                 self.reactor_surface = None
                 self.board_surface = None
-                self.game_over_surface = TimeOver(self.screen, 0, 0, self.dt)
+                self.game_over_surface = self.scene(screens.TimeOver)
 
+        self.scenes.show(self.surfaces())
 
+    def draw(self):
+        self.compositor.present(self.surfaces())
 
     def event_handler(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
 
+            self.record_event(event)
             for surface in [self.reactor_surface, self.board_surface, self.menu_surface, self.game_over_surface]:
                 if surface is not None:
                     action = surface.event_handler(event)
+                    if action is not None and self.recording is not None:
+                        self.recording.action(self.tick, action)
 
                     if action == "Menu":
                         self.reactor_surface.paused = True
@@ -89,7 +187,7 @@ class Window:
                         self.board_surface = None
                         self.game_over_surface = None
                         self.upgrade_surface = None
-                        self.menu_surface = Menu(self.screen, 0, 0, self.dt, paused=True)
+                        self.menu_surface = self.menu(paused=True)
 
                     elif action == "Continue":
                         self.reactor_surface = self.paused_reactor
@@ -105,26 +203,26 @@ class Window:
                         self.game_over_surface = None
                         self.menu_surface = None
                         self.upgrade_surface = None
-                        self.reactor_surface = Reactor(self.screen, 0, 100, self.dt)
-                        self.board_surface = Board(self.screen, 0, 0, self.dt)
+                        self.reactor_surface = self.new_reactor()
+                        self.board_surface = self.scene(screens.Board)
                         self.available_power= 0
 
                     elif action == "Session Over":
                         self.menu_surface = None
                         self.upgrade_surface = None
-                        self.reactor_surface = Reactor(self.screen, 0, 100, self.dt)
-                        self.board_surface = Board(self.screen, 0, 0, self.dt)
+                        self.reactor_surface = self.new_reactor()
+                        self.board_surface = self.scene(screens.Board)
 
                     elif action == "New Session":
                         self.game_over_surface = None
                         self.menu_surface = None
                         self.upgrade_surface = None
-                        self.reactor_surface = Reactor(self.screen, 0, 100, self.dt)
-                        self.board_surface = Board(self.screen, 0, 0, self.dt)
-                        self.reactor_surface.generated_power.extend([1] * self.available_power)
+                        self.reactor_surface = self.new_reactor()
+                        self.board_surface = self.scene(screens.Board)
+                        self.reactor_surface.generated_power.carry_over(self.available_power)
 
                     elif action == "Upgrade":
-                        self.game_over_surface = Upgrader(self.screen, 0, 0, self.dt)
+                        self.game_over_surface = self.scene(screens.Upgrader)
                         self.menu_surface = None
                         self.upgrade_surface = None
                         self.reactor_surface = None
@@ -136,19 +234,47 @@ class Window:
                     elif action == "Exit":
                         self.running = False
 
+        self.scenes.show(self.surfaces())
+
     def run(self):
+        accumulator = 0.0
         while self.running:
+            accumulator += self.clock.tick(self.fps) / 1000.0
             self.event_handler()
 
-            for surface in [self.menu_surface, self.reactor_surface, self.board_surface, self.game_over_surface]:
-                if surface is not None:
-                    surface.hover_handler()
-                    surface.draw()
+            steps = 0
+            while accumulator >= self.dt and steps < self.max_substeps:
+                self.update()
+                accumulator -= self.dt
+                steps += 1
 
-            self.screen.fill((0, 0, 0))
-            self.draw()
+            if accumulator >= self.dt:
+                # Too far behind to catch up: drop the backlog instead of
+                # spending ever more of each frame on simulation.
+                accumulator %= self.dt
+
+            alpha = accumulator / self.dt
+            for surface in self.surfaces():
+                surface.hover_handler()
+                surface.draw(alpha)
 
-            pygame.display.flip()
-            self.clock.tick(self.fps)
+            self.draw()
 
+            if not startup_report.reached("interactive"):
+                startup_report.mark("first_frame")
+                if self.interactive():
+                    startup_report.mark("interactive")
+                    if self.report_startup:
+                        startup_report.print()
+
+        if self.recording is not None:
+            self.recording.ticks = self.tick
+            self.recording.save(self.record)
+        reactor = self.scenes.pool.get(screens.Reactor) if self.profile is not None else None
+        if reactor is not None and reactor.sim.timer.enabled:
+            reactor.sim.timer.export(self.profile)
+        self.scenes.close()
         pygame.quit()
+
+
+startup_report.mark("import")